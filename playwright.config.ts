@@ -16,8 +16,12 @@ export default defineConfig({
   forbidOnly: !!process.env.CI,
   /* Retry on CI only */
   retries: process.env.CI ? 2 : 0,
-  /* Opt out of parallel tests on CI. */
-  workers: process.env.CI ? 1 : undefined,
+  /* Two workers on CI. Every test runs in its own browser context (fresh
+   * IndexedDB/localStorage, mock Firestore state kept in that context), so
+   * Chromium tests don't share app state and parallelize safely; two matches
+   * the 4-vCPU hosted runners without starving the preview server. WebKit is
+   * still serialized by run_verification.sh (--workers=1). */
+  workers: process.env.CI ? 2 : undefined,
   /* Reporter to use. See https://playwright.dev/docs/reporters */
   reporter: 'dot',
   /* Shared settings for all the projects below. See https://playwright.dev/docs/api/class-testoptions. */
@@ -26,22 +30,47 @@ export default defineConfig({
      * Default: https (local dev server via `npm run dev`).
      * Docker: run_verification.sh passes BASE_URL=http://localhost:5173 explicitly. */
     baseURL: process.env.BASE_URL ?? 'https://localhost:5173',
-    /* Collect trace when retrying the failed test. See https://playwright.dev/docs/trace-viewer */
-    trace: 'on-first-retry',
-    /* Browser launch options */
+    /* Collect trace when retrying the failed test. See https://playwright.dev/docs/trace-viewer
+     * The screencast is off: DOM snapshots already show each step, and
+     * per-step screenshots made retry traces of the long journeys (and their
+     * polling waits) balloon while slowing the retry they were diagnosing.
+     * Specs keep their own captureScreenshot() artifacts. */
+    trace: { mode: 'on-first-retry', screenshots: false, snapshots: true, sources: true },
+    /* Browser launch options. The last four keep Chromium lean in the
+     * container: write shared memory to /tmp rather than /dev/shm (only a
+     * 64MB default when the image runs without run_verification.sh's
+     * --ipc=host), skip the GPU process the headless runs never use, and drop
+     * component-update / extension background work. Headless runs already use
+     * the chromium-headless-shell build, and Playwright's own defaults cover
+     * --disable-sync / --disable-default-apps and the sandbox. */
     launchOptions: {
       args: [
         '--disable-web-security',
         '--disable-features=IsolateOrigins,site-per-process',
         '--ignore-certificate-errors',
+        '--disable-dev-shm-usage',
+        '--disable-gpu',
+        '--disable-background-networking',
+        '--disable-extensions',
       ],
     },
   },
 
   /* Configure projects for major browsers */
   projects: [
+    {
+      // Imports the demo book once and snapshots storage + IndexedDB to
+      // verification/.state/library.json (utils.ts LIBRARY_STATE). Specs that
+      // opt into that storageState skip their own EPUB ingest.
+      name: 'library-setup',
+      testMatch: /library\.setup\.ts/,
+      use: {
+        ...devices['Desktop Chrome'],
+      },
+    },
     {
       name: 'desktop',
+      dependencies: ['library-setup'],
       use: {
         ...devices['Desktop Chrome'],
         viewport: { width: 1280, height: 720 },
@@ -49,6 +78,7 @@ export default defineConfig({
     },
     {
       name: 'mobile',
+      dependencies: ['library-setup'],
       use: {
         ...devices['Pixel 5'],
         viewport: { width: 375, height: 667 },
@@ -58,6 +88,7 @@ export default defineConfig({
     },
     {
       name: 'webkit',
+      dependencies: ['library-setup'],
       use: {
         ...devices['Desktop Safari'],
         viewport: { width: 1280, height: 720 },
@@ -50,7 +50,11 @@ if [[ "$1" == "--help" ]]; then
   echo "      ./run_verification.sh --logs verification/test_journey_library.spec.ts"
   echo ""
   echo "  - Enable the IndexedDB/event-loop hang probe (sets TTS_IDB_PROBE=1):"
-  echo "      ./run_verification.sh --probe verification/test_tts_queue.spec.ts"
+  echo "      ./run_verification.sh --probe verification/test_tts_queue_interaction.spec.ts"
+  echo ""
+  echo "Environment:"
+  echo "  - VERIFY_SKIP_BUILD=1 skips 'docker build' and runs the existing"
+  echo "    'versicle-verify' image (CI prebuilds it with a cached layer store)."
   echo ""
   echo "Artifacts:"
   echo "  - Screenshots and test artifacts are saved to 'verification/screenshots'."
@@ -101,8 +105,13 @@ if [[ "$TARGETS_WEBKIT" == true && "$USER_SET_WORKERS" == false ]]; then
   PASSTHROUGH_ARGS+=("--workers=1")
 fi
 
-# Build the test image
-docker build -t versicle-verify -f Dockerfile.verification .
+# Build the test image. VERIFY_SKIP_BUILD=1 reuses an existing 'versicle-verify'
+# image — CI builds it beforehand with a layer cache (e2e-verification.yml).
+if [[ "$VERIFY_SKIP_BUILD" == "1" ]]; then
+  echo "♻️  VERIFY_SKIP_BUILD=1 — using the prebuilt versicle-verify image."
+else
+  docker build -t versicle-verify -f Dockerfile.verification .
+fi
 
 # Create host directories for persisted artifacts if they don't exist
 mkdir -p verification/screenshots
@@ -114,7 +123,7 @@ echo "🏃 Running verification tests..."
 # --ipc=host: Playwright's recommended setting for browsers in Docker. The default
 #   64MB /dev/shm starves the browser's shared memory and causes renderer "Page
 #   crashed" failures (notably in WebKit on long, memory-heavy journeys).
-# test-results/ is mounted too so Playwright traces (trace: 'on-first-retry')
+# test-results/ is mounted too so Playwright traces (on-first-retry, DOM snapshots only)
 # and failure context survive the container — CI uploads them on failure.
 docker run --rm \
   --ipc=host \
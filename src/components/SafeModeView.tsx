@@ -19,7 +19,7 @@ interface SafeModeViewProps {
  */
 export const SafeModeView: React.FC<SafeModeViewProps> = ({ error, onReset, onRetry }) => {
   return (
-    <div className="flex flex-col items-center justify-center min-h-screen bg-background text-foreground p-6 text-center">
+    <div data-testid="safe-mode-view" className="flex flex-col items-center justify-center min-h-screen bg-background text-foreground p-6 text-center">
       <h1 className="text-3xl font-bold text-destructive mb-4">Safe Mode</h1>
       <p className="text-lg text-muted-foreground mb-6 max-w-md">
         The application failed to initialize the database. This might be due to corruption or a storage error.
@@ -45,7 +45,7 @@ export const EmptyLibrary: React.FC<EmptyLibraryProps> = ({ onImport }) => {
   };
 
   return (
-    <div className="flex flex-col items-center justify-center py-20 text-center px-4 max-w-2xl mx-auto">
+    <div data-testid="empty-library" className="flex flex-col items-center justify-center py-20 text-center px-4 max-w-2xl mx-auto">
       <div className="mb-6 p-6 bg-muted/20 rounded-full animate-in fade-in zoom-in duration-500">
         <Library className="w-16 h-16 text-muted-foreground/40" />
       </div>
@@ -85,6 +85,7 @@ export const EmptyLibrary: React.FC<EmptyLibraryProps> = ({ onImport }) => {
           variant="outline"
           onClick={handleLoadDemo}
           disabled={isImporting}
+          data-testid="load-demo-button"
           className="text-primary font-medium gap-2 h-12 px-6 border-primary/20 hover:bg-primary/5 hover:text-primary transition-all touch-manipulation w-full sm:w-auto"
           aria-label={isImporting ? "Loading demo book..." : "Load Demo Book (Alice in Wonderland)"}
         >
@@ -7,19 +7,26 @@ npm run preview -- --port 5173 --host &
 PID=$!
 
 # 2. Wait for the Server to be Ready
+# One preflight for the whole run: poll every 200ms (the preview server is
+# usually up in well under a second, so a 1s poll was mostly dead time) until
+# a 30s wall-clock deadline. -f makes an HTTP error count as "not ready";
+# --max-time keeps a half-open socket from hanging a single probe (a probe
+# can still overrun the deadline by at most that 1s). If the server never
+# comes up, fail here once instead of letting every spec burn its goto timeout.
 echo "⏳ Waiting for application to be ready at http://localhost:5173..."
-RETRIES=30
-for i in $(seq 1 $RETRIES); do
-    if curl -s http://localhost:5173 > /dev/null; then
-        echo "✅ Application is ready!"
-        break
+DEADLINE=$((SECONDS + 30))
+until curl -sf --max-time 1 http://localhost:5173 > /dev/null; do
+    if ! kill -0 $PID 2>/dev/null; then
+        echo "❌ Preview server exited before becoming ready."
+        exit 1
     fi
-    if [ "$i" -eq "$RETRIES" ]; then
+    if [ "$SECONDS" -ge "$DEADLINE" ]; then
         echo "❌ Timeout waiting for application to start."
         exit 1
     fi
-    sleep 1
+    sleep 0.2
 done
+echo "✅ Application is ready!"
 
 # 3. Run Verification Tests
 echo "🧪 Running verification suite..."
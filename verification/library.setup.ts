@@ -0,0 +1,20 @@
+import { test, resetApp, ensureLibraryWithBook, waitForPersistedWrites, LIBRARY_STATE } from './utils';
+
+/**
+ * One-shot library seed (the `library-setup` project in playwright.config.ts).
+ *
+ * Imports the demo book once per run and snapshots the origin's storage —
+ * localStorage AND both IndexedDB databases (`EpubLibraryDB` + the y-idb
+ * `versicle-yjs` doc) — to LIBRARY_STATE. Specs that only need "a library
+ * with Alice in it" opt in with `test.use({ storageState: LIBRARY_STATE })`
+ * plus `openSeededLibrary(page)`, and skip the EPUB parse + IDB ingest that
+ * otherwise dominates their setup.
+ */
+test('seed library with the demo book', async ({ page }) => {
+  await resetApp(page);
+  await ensureLibraryWithBook(page);
+  // The library entry lives in the debounced Yjs doc: flush it so the
+  // snapshot below captures a committed library, not an empty one.
+  await waitForPersistedWrites(page);
+  await page.context().storageState({ path: LIBRARY_STATE, indexedDB: true });
+});
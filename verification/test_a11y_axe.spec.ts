@@ -139,11 +139,12 @@ test('a11y scan: reader surface', { tag: '@a11y' }, async ({ page }, testInfo) =
   // Scan the SETTLED reader surface, not a mid-mount frame. The reader route is
   // React.lazy (epubjs is a lazy chunk, Phase 8); under full-suite CPU load the
   // Suspense fallback / first paint briefly leaves one node outside a landmark
-  // before the chrome finishes mounting. Wait for the lazy chunk + network to go
-  // idle and the reader header (a banner landmark) to be present. 'region' stays
-  // in expectAbsentRules below, so a PERSISTENT regression still fails — this only
+  // before the chrome finishes mounting. Wait for the engine's first rendered
+  // location (the lazy chunk has loaded and the reader has painted) and the
+  // reader header (a banner landmark) to be present. 'region' stays in
+  // expectAbsentRules below, so a PERSISTENT regression still fails — this only
   // makes the scan trigger deterministic on the actual surface.
-  await page.waitForLoadState('networkidle');
+  await utils.waitForReaderReady(page);
   await expect(page.getByTestId('reader-header')).toBeVisible();
 
   // Phase 6 fixed findings (see header): titled iframe + interactive
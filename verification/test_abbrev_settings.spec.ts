@@ -7,7 +7,7 @@ test('Abbreviation Settings Verification', async ({ page }) => {
   await utils.ensureLibraryWithBook(page);
 
   // Click the book to navigate to reader
-  await page.getByText("Alice's Adventures in Wonderland").first().click();
+  await page.locator("[data-testid^='book-card-']").first().click();
 
   // Wait for navigation to reader
   await expect(page).toHaveURL(/.*\/read\/.*/, { timeout: 10000 });
@@ -22,9 +22,11 @@ test('Abbreviation Settings Verification', async ({ page }) => {
   await page.getByRole('tab', { name: 'Dictionary' }).click();
 
   // 3. Verify TTS/Abbreviation settings are visible
-  await expect(page.getByRole('heading', { name: 'Abbreviations', exact: true })).toBeVisible({ timeout: 5000 });
-  await expect(page.getByRole('heading', { name: 'Always Merge', exact: true })).toBeVisible({ timeout: 5000 });
-  await expect(page.getByRole('heading', { name: 'Sentence Starters', exact: true })).toBeVisible({ timeout: 5000 });
+  await Promise.all([
+    expect(page.getByRole('heading', { name: 'Abbreviations', exact: true })).toBeVisible({ timeout: 5000 }),
+    expect(page.getByRole('heading', { name: 'Always Merge', exact: true })).toBeVisible({ timeout: 5000 }),
+    expect(page.getByRole('heading', { name: 'Sentence Starters', exact: true })).toBeVisible({ timeout: 5000 }),
+  ]);
 
   // Check for Export/Import buttons (we have 3 sets now)
   await expect(page.locator("button[title='Download CSV']")).toHaveCount(3, { timeout: 5000 });
@@ -12,14 +12,16 @@
  */
 import { test, expect } from "./utils";
 import {
-  resetApp,
-  ensureLibraryWithBook,
+  openSeededLibrary,
   navigateToChapter,
   waitForReaderReady,
   captureScreenshot,
+  LIBRARY_STATE,
 } from "./utils";
 import type { Page } from "@playwright/test";
 
+test.use({ storageState: LIBRARY_STATE });
+
 /** Live reader CFI via the typed test API (null before a reader mounts). */
 async function getCurrentCfi(page: Page): Promise<string | null> {
   return page.evaluate(() => window.__versicleTest?.reader?.currentCfi?.() ?? null);
@@ -31,8 +33,7 @@ async function getCurrentHref(page: Page): Promise<string | null> {
 }
 
 test("page-turn rails turn pages in paginated mode", async ({ page }) => {
-  await resetApp(page);
-  await ensureLibraryWithBook(page);
+  await openSeededLibrary(page);
 
   // Open the book and wait for the engine + locations registry.
   await page.locator("[data-testid^='book-card-']").first().click();
@@ -80,8 +81,7 @@ test("page-turn rails turn pages in paginated mode", async ({ page }) => {
 });
 
 test("compass-pill arrows are a pure audio transport (disabled idle, enabled during audio)", async ({ page }) => {
-  await resetApp(page);
-  await ensureLibraryWithBook(page);
+  await openSeededLibrary(page);
 
   await page.locator("[data-testid^='book-card-']").first().click();
   await expect(page.getByTestId("reader-back-button")).toBeVisible();
@@ -1,29 +1,32 @@
-import { test } from './utils';
+import { test, waitForReaderReady, blockDecorativeAssets } from './utils';
 
 test('verify event history', async ({ page }) => {
+  await blockDecorativeAssets(page);
   console.log('Navigating to app...');
   await page.goto('/');
 
-  // Handle empty library / Load Demo
-  try {
-    await page.waitForSelector('text=Your library is empty', { timeout: 10000 });
+  // Handle empty library / Load Demo. Wait for whichever boot state renders
+  // first: probing for the empty state alone sat out its full 10s whenever
+  // the library already had a book.
+  const emptyLibrary = page.getByTestId('empty-library');
+  const bookCard = page.locator("[data-testid^='book-card-']");
+  await emptyLibrary.or(bookCard).first().waitFor({ timeout: 20000 });
+  if (await emptyLibrary.isVisible()) {
     console.log('Library empty. Loading demo book...');
-    await page.click('text=Load Demo Book');
-  } catch {
-    console.log('Library not empty or loaded.');
+    await page.getByTestId('load-demo-button').click();
   }
 
   // Open book
   console.log('Opening book...');
-  await page.waitForSelector("[data-testid^='book-card-']", { timeout: 20000 });
+  await bookCard.first().waitFor({ timeout: 20000 });
   await page.click("[data-testid^='book-card-']:first-child");
 
   // Wait for reader
   await page.waitForSelector("[data-testid='reader-view']", { timeout: 15000 });
   console.log('Reader loaded.');
 
-  // Allow epub.js/iframe to stabilize before freezing time
-  await page.waitForTimeout(2000);
+  // Let epub.js render its first location before freezing time
+  await waitForReaderReady(page);
 
   // Install Clock
   console.log('Installing clock...');
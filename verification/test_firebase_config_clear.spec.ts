@@ -1,6 +1,7 @@
-import { test, expect, openSettings, gotoSettingsTab, acceptConfirm } from './utils';
+import { test, expect, openSettings, gotoSettingsTab, acceptConfirm, blockDecorativeAssets } from './utils';
 
 test('verify firebase config clear', async ({ page }) => {
+  await blockDecorativeAssets(page);
   // Navigate to app
   await page.goto('/');
 
@@ -13,6 +13,8 @@ async function uploadBook(page: Page, filename: string) {
   const filePath = path.resolve(__dirname, filename);
   const fileBuffer = fs.readFileSync(filePath);
   const fileBase64 = fileBuffer.toString('base64');
+  const cards = page.locator("[data-testid^='book-card-']");
+  const before = await cards.count();
 
   await page.evaluate(({ base64Data, filename }) => {
     const byteCharacters = atob(base64Data);
@@ -29,8 +31,9 @@ async function uploadBook(page: Page, filename: string) {
     document.querySelector('[data-testid="library-view"]')!.dispatchEvent(dropEvent);
   }, { base64Data: fileBase64, filename });
 
-  // Small wait for ingestion to start
-  await page.waitForTimeout(2000);
+  // Return once the ingest has landed a new card, so the next drop never
+  // races an import that is still in flight.
+  await expect(cards).toHaveCount(before + 1, { timeout: utils.INGEST_TIMEOUT });
 }
 
 test('Language Scoped Font Profiles Test', async ({ page }) => {
@@ -45,8 +48,8 @@ test('Language Scoped Font Profiles Test', async ({ page }) => {
   const enBook = page.locator("[data-testid^='book-card-']", { hasText: "Alice's Adventures in Wonderland" }).first();
   const zhBook = page.locator("[data-testid^='book-card-']", { hasText: 'Test Chinese Book' }).first();
 
-  await expect(enBook).toBeVisible({ timeout: 30000 });
-  await expect(zhBook).toBeVisible({ timeout: 30000 });
+  await expect(enBook).toBeVisible({ timeout: utils.INGEST_TIMEOUT });
+  await expect(zhBook).toBeVisible({ timeout: utils.INGEST_TIMEOUT });
 
   // 2. Open English Book and set size to 80%
   console.log('--- Phase 1: Setting English Profile ---');
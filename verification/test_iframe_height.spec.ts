@@ -1,20 +1,21 @@
 import { test, expect } from './utils';
 import * as utils from './utils';
 
+test.use({ storageState: utils.LIBRARY_STATE });
+
 test('Iframe Height Verification', async ({ page }) => {
   // Verifies that the reader iframe container is reduced in height in paginated mode
   // to accommodate the bottom navigation pill.
   console.log('Starting Iframe Height Verification...');
-  await utils.resetApp(page);
-  await utils.ensureLibraryWithBook(page);
+  await utils.openSeededLibrary(page);
 
   // Open Book
   console.log('Opening book...');
   await page.locator("[data-testid^='book-card-']").first().click();
   await expect(page).toHaveURL(/.*\/read\/.*/);
 
-  // Wait for reader to be ready
-  await page.waitForTimeout(3000);
+  // Wait for the first relocation: the rendition has actually drawn
+  await utils.waitForReaderReady(page);
 
   // Get the container element
   const container = page.locator('[data-testid="reader-iframe-container"]');
@@ -1,10 +1,12 @@
 import { test, expect } from './utils';
 import * as utils from './utils';
 
+test.use({ storageState: utils.LIBRARY_STATE });
+
 test('ARIA Labels Verification', async ({ page }) => {
   console.log('Starting ARIA Labels Verification...');
-  await utils.resetApp(page);
-  await utils.ensureLibraryWithBook(page);
+  await utils.blockDecorativeAssets(page);
+  await utils.openSeededLibrary(page);
 
   // Open Book
   console.log('Opening book...');
@@ -43,9 +43,11 @@ test('Journey Audio Test', async ({ page }) => {
   await expect(page.getByText('Audio Deck')).toBeVisible();
 
   // Verify Stage Buttons
-  await expect(page.getByRole('dialog').getByLabel('Play')).toBeVisible();
-  await expect(page.getByTestId('tts-rewind-button')).toBeVisible();
-  await expect(page.getByTestId('tts-forward-button')).toBeVisible();
+  await Promise.all([
+    expect(page.getByRole('dialog').getByLabel('Play')).toBeVisible(),
+    expect(page.getByTestId('tts-rewind-button')).toBeVisible(),
+    expect(page.getByTestId('tts-forward-button')).toBeVisible(),
+  ]);
 
   // Switch to Settings
   console.log('Switching to Audio Settings...');
@@ -32,8 +32,9 @@ test('Journey Backup & Restore (Light JSON)', async ({ page }) => {
 
   await page.getByTestId("reader-settings-button").click({ force: true });
   await expect(page.getByRole("tablist", { name: "Settings sections" })).toBeVisible({ timeout: 10000 });
-  await page.getByRole("tab", { name: "Dictionary" }).scrollIntoViewIfNeeded().catch(() => {});
-  await page.getByRole("tab", { name: "Dictionary" }).click();
+  const dictionaryTab = page.getByRole("tab", { name: "Dictionary" });
+  await dictionaryTab.scrollIntoViewIfNeeded().catch(() => {});
+  await dictionaryTab.click();
   await page.getByRole("button", { name: "Manage Rules" }).click();
   await page.getByTestId("lexicon-add-rule-btn").click();
 
@@ -60,8 +61,9 @@ test('Journey Backup & Restore (Light JSON)', async ({ page }) => {
   await expect(page.getByRole("tablist", { name: "Settings sections" })).toBeVisible({ timeout: 10000 });
 
   if (!(await page.getByRole("button", { name: "Quick JSON Export" }).isVisible())) {
-    await page.getByRole("tab", { name: "Data Management" }).scrollIntoViewIfNeeded().catch(() => {});
-  await page.getByRole("tab", { name: "Data Management" }).click({ force: true });
+    const dataTab = page.getByRole("tab", { name: "Data Management" });
+    await dataTab.scrollIntoViewIfNeeded().catch(() => {});
+    await dataTab.click({ force: true });
   }
 
   // Setup download listener
@@ -100,8 +102,9 @@ test('Journey Backup & Restore (Light JSON)', async ({ page }) => {
   await expect(page.getByRole("tablist", { name: "Settings sections" })).toBeVisible({ timeout: 10000 });
 
   if (!(await page.getByRole("button", { name: "Quick JSON Export" }).isVisible())) {
-    await page.getByRole("tab", { name: "Data Management" }).scrollIntoViewIfNeeded().catch(() => {});
-  await page.getByRole("tab", { name: "Data Management" }).click({ force: true });
+    const dataTab = page.getByRole("tab", { name: "Data Management" });
+    await dataTab.scrollIntoViewIfNeeded().catch(() => {});
+    await dataTab.click({ force: true });
   }
 
   // The Data panel is lazy-loaded (settings registry import()); under load its
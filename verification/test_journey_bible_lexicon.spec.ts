@@ -31,7 +31,7 @@ test('Journey Bible Lexicon Test', async ({ page }) => {
 
   // 4. Open Book to check Per-Book Overrides
   console.log('Opening Book...');
-  await page.getByText("Alice's Adventures in Wonderland").first().click();
+  await page.locator("[data-testid^='book-card-']").first().click();
   await expect(page).toHaveURL(/.*\/read\/.*/, { timeout: 10000 });
 
   // 5. Open the Lexicon Manager from the reader's Audio Deck.
@@ -56,9 +56,11 @@ test('Journey Bible Lexicon Test', async ({ page }) => {
 
   // Verify Bible Preference Buttons (Default / On / Off)
   console.log('Verifying Preference Buttons...');
-  await expect(page.getByTestId('lexicon-pref-default')).toBeVisible();
-  await expect(page.getByTestId('lexicon-pref-on')).toBeVisible();
-  await expect(page.getByTestId('lexicon-pref-off')).toBeVisible();
+  await Promise.all([
+    expect(page.getByTestId('lexicon-pref-default')).toBeVisible(),
+    expect(page.getByTestId('lexicon-pref-on')).toBeVisible(),
+    expect(page.getByTestId('lexicon-pref-off')).toBeVisible(),
+  ]);
 
   // 7. Test Bible Lexicon OFF logic
   console.log('Testing Bible Lexicon OFF replacement...');
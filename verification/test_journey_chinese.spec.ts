@@ -94,11 +94,10 @@ test('Chinese Book Journey', async ({ page }) => {
 
   // Back to library
   const backBtn = page.getByTestId('reader-back-button');
-  if (!(await backBtn.isVisible())) {
+  if (!(await utils.becomesVisible(backBtn))) {
     await page.locator('body').click({ position: { x: 200, y: 200 } });
-    await page.waitForTimeout(500);
   }
-  if (await backBtn.isVisible()) {
+  if (await utils.becomesVisible(backBtn)) {
     await backBtn.click();
     await page.waitForTimeout(1000);
   }
@@ -28,9 +28,11 @@ test('Engine Room Journey Test', async ({ page }) => {
   }
 
   // Verify Tabs exist (Radix Tabs → role="tab", not role="button").
-  await expect(page.getByRole('tab', { name: 'General' })).toBeVisible();
-  await expect(page.getByRole('tab', { name: 'TTS Engine' })).toBeVisible();
-  await expect(page.getByRole('tab', { name: 'Dictionary' })).toBeVisible();
+  await Promise.all([
+    expect(page.getByRole('tab', { name: 'General' })).toBeVisible(),
+    expect(page.getByRole('tab', { name: 'TTS Engine' })).toBeVisible(),
+    expect(page.getByRole('tab', { name: 'Dictionary' })).toBeVisible(),
+  ]);
 
   // Check General Tab Content (default)
   await expect(page.getByRole('heading', { name: 'Advanced Import' })).toBeVisible();
@@ -50,7 +52,7 @@ test('Engine Room Journey Test', async ({ page }) => {
   await utils.ensureLibraryWithBook(page);
   await page.locator("[data-testid^='book-card-']").first().click();
   await expect(page).toHaveURL(/.*\/read\/.*/);
-  await page.waitForTimeout(2000);
+  await utils.waitForReaderReady(page);
 
   // Click Settings (Gear) — nests Settings under /read/:id/settings (overlay
   // over the live reader, which stays mounted behind it).
@@ -60,23 +62,19 @@ test('Engine Room Journey Test', async ({ page }) => {
   await expect(page.getByRole('dialog')).toBeVisible();
   await expect(page.getByRole('tab', { name: 'General' })).toBeVisible();
 
-  // Capture General Tab
   await utils.captureScreenshot(page, 'settings_01_general');
 
-  // Capture Dictionary Tab
+  // The panels must also render inside the reader overlay, not just over the
+  // library. Screenshots of each tab live in test_journey_ui_states'
+  // "settings tabs journey", so only the content is checked here.
   await page.getByRole('tab', { name: 'Dictionary' }).click();
   await expect(page.getByText('Text Segmentation')).toBeVisible();
-  await utils.captureScreenshot(page, 'settings_02_dictionary');
 
-  // Capture Data Management Tab
   await page.getByRole('tab', { name: 'Data Management' }).click();
   await expect(page.getByText('Danger Zone')).toBeVisible();
-  await utils.captureScreenshot(page, 'settings_03_data');
 
-  // Capture TTS Tab
   await page.getByRole('tab', { name: 'TTS Engine' }).click();
   await expect(page.getByText('Provider Configuration')).toBeVisible();
-  await utils.captureScreenshot(page, 'settings_04_tts');
 
   console.log('Engine Room Journey Passed!');
 });
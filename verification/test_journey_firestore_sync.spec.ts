@@ -29,50 +29,43 @@ async function uploadBook(page: Page, filename: string) {
   }, { base64Data: fileBase64, filename });
 }
 
-test('Firestore Book Sync and Restore', async ({ browser }) => {
+/**
+ * Hand device A's mock-Firestore snapshot to a fresh device before it boots,
+ * registering the workspace the snapshot points at. Both values travel as a
+ * structured init-script argument, not spliced into script source, so the
+ * snapshot JSON needs no escaping.
+ */
+async function seedMockSnapshot(page: Page, snapshot: string) {
+  const pathKey = Object.keys(JSON.parse(snapshot)).find((k) => k.includes('/versicle/ws_'));
+  const workspaceId = pathKey?.split('/').pop() ?? null;
+  await page.addInitScript(({ snapshot, workspaceId }) => {
+    localStorage.setItem('versicle_mock_firestore_snapshot', snapshot);
+    if (workspaceId) {
+      localStorage.setItem('__VERSICLE_WORKSPACES__', JSON.stringify([{
+        workspaceId,
+        name: 'My Library',
+        createdAt: Date.now(),
+        schemaVersion: 5
+      }]));
+    }
+  }, { snapshot, workspaceId });
+}
+
+const DESKTOP = { viewport: { width: 1280, height: 720 } };
+
+test('Firestore Book Sync and Restore', async ({ newDevicePage }) => {
   test.setTimeout(180_000);
   console.log('========== DEVICE A: Import Book & Sync ==========');
   
-  const contextA = await browser.newContext({
-    viewport: { width: 1280, height: 720 }
+  const pageA = await newDevicePage({
+    label: 'A',
+    contextOptions: DESKTOP,
+    initScript: 'window.__VERSICLE_MOCK_FIRESTORE__ = true; window.__VERSICLE_FIRESTORE_DEBOUNCE_MS__ = 20;',
   });
-  const pageA = await contextA.newPage();
-
-  pageA.on('console', (msg) => console.log(`[A] ${msg.text()}`));
-  pageA.on('pageerror', (err) => console.error(`[A ERROR] ${err}`));
-
-  // Inject polyfill content
-  const ttsPolyfillPath = path.resolve(__dirname, 'tts-polyfill.js');
-  const ttsPolyfillContent = fs.readFileSync(ttsPolyfillPath, 'utf8');
 
-  await pageA.addInitScript({ content: 'window.__VERSICLE_MOCK_FIRESTORE__ = true;' });
-  await pageA.addInitScript({ content: 'window.__VERSICLE_SANITIZATION_DISABLED__ = true;' });
-  await pageA.addInitScript({ content: 'window.__VERSICLE_FIRESTORE_DEBOUNCE_MS__ = 20;' });
-  await pageA.addInitScript({ content: ttsPolyfillContent });
-
-  // Clear data
+  // Fresh context (newDevicePage): storage is already empty, so one
+  // navigation is the clean boot — no wipe + reload.
   await pageA.goto('/');
-  await pageA.evaluate(async () => {
-    if (typeof (window as any /* eslint-disable-line @typescript-eslint/no-explicit-any */).__DISCONNECT_YJS__ === 'function') {
-      await (window as any /* eslint-disable-line @typescript-eslint/no-explicit-any */).__DISCONNECT_YJS__();
-    }
-    if (typeof (window as any /* eslint-disable-line @typescript-eslint/no-explicit-any */).__CLOSE_DB__ === 'function') {
-      await (window as any /* eslint-disable-line @typescript-eslint/no-explicit-any */).__CLOSE_DB__();
-    }
-    const dbs = await window.indexedDB.databases();
-    for (const db of dbs) {
-      if (db.name) {
-        await new Promise<void>((resolve) => {
-          const req = window.indexedDB.deleteDatabase(db.name!);
-          req.onsuccess = () => resolve();
-          req.onerror = () => resolve();
-          req.onblocked = () => resolve();
-        });
-      }
-    }
-    localStorage.clear();
-  });
-  await pageA.reload();
 
   await expect(pageA.getByTestId('library-view')).toBeVisible({ timeout: 15000 });
 
@@ -110,43 +103,20 @@ test('Firestore Book Sync and Restore', async ({ browser }) => {
   const snapshotB64 = mockData[syncPath!].snapshotBase64;
   expect(snapshotB64).toBeTruthy();
 
-  await pageA.close();
-  await contextA.close();
+  await pageA.context().close();
 
   console.log('========== DEVICE B: Load Synced Data ==========');
   
-  const contextB = await browser.newContext({
-    viewport: { width: 1280, height: 720 }
+  const pageB = await newDevicePage({
+    label: 'B',
+    contextOptions: DESKTOP,
+    initScript: `
+      window.__VERSICLE_MOCK_FIRESTORE__ = true;
+      window.__VERSICLE_MOCK_USER_ID__ = 'mock-user';
+      window.__VERSICLE_FIRESTORE_DEBOUNCE_MS__ = 20;
+    `,
   });
-  const pageB = await contextB.newPage();
-
-  pageB.on('console', (msg) => console.log(`[B] ${msg.text()}`));
-  pageB.on('pageerror', (err) => console.error(`[B ERROR] ${err}`));
-
-  let injectionCode = `
-    window.__VERSICLE_MOCK_FIRESTORE__ = true;
-    window.__VERSICLE_MOCK_USER_ID__ = 'mock-user';
-    window.__VERSICLE_SANITIZATION_DISABLED__ = true;
-    window.__VERSICLE_FIRESTORE_DEBOUNCE_MS__ = 20;
-    localStorage.setItem('versicle_mock_firestore_snapshot', ${JSON.stringify(mockDataStr)});
-  `;
-
-  const snapshotDict = JSON.parse(mockDataStr!);
-  const pathKey = Object.keys(snapshotDict).find((k) => k.includes('/versicle/ws_'));
-  if (pathKey) {
-    const workspaceId = pathKey.split('/').pop();
-    injectionCode += `
-      localStorage.setItem('__VERSICLE_WORKSPACES__', JSON.stringify([{
-        workspaceId: '${workspaceId}',
-        name: 'My Library',
-        createdAt: Date.now(),
-        schemaVersion: 5
-      }]));
-    `;
-  }
-
-  await pageB.addInitScript({ content: injectionCode });
-  await pageB.addInitScript({ content: ttsPolyfillContent });
+  await seedMockSnapshot(pageB, mockDataStr!);
 
   await pageB.goto('/');
   await expect(pageB.getByTestId('library-view')).toBeVisible({ timeout: 15000 });
@@ -249,46 +219,17 @@ test('Firestore Book Sync and Restore', async ({ browser }) => {
   await expect(pageB.locator("div[data-state='open'].bg-black\\/50")).toHaveCount(0, { timeout: 10000 });
   await bookCardAlice.dispatchEvent("click");
   await expect(pageB.getByTestId('reader-iframe-container')).toBeVisible({ timeout: 10000 });
-
-  await pageB.close();
-  await contextB.close();
 });
 
-test('Offload Status Hydration', async ({ browser }) => {
-  const contextA = await browser.newContext({
-    viewport: { width: 1280, height: 720 }
+test('Offload Status Hydration', async ({ newDevicePage }) => {
+  const pageA = await newDevicePage({
+    contextOptions: DESKTOP,
+    initScript: 'window.__VERSICLE_MOCK_FIRESTORE__ = true;',
   });
-  const pageA = await contextA.newPage();
-
-  const ttsPolyfillPath = path.resolve(__dirname, 'tts-polyfill.js');
-  const ttsPolyfillContent = fs.readFileSync(ttsPolyfillPath, 'utf8');
-
-  await pageA.addInitScript({ content: 'window.__VERSICLE_MOCK_FIRESTORE__ = true;' });
-  await pageA.addInitScript({ content: 'window.__VERSICLE_SANITIZATION_DISABLED__ = true;' });
-  await pageA.addInitScript({ content: ttsPolyfillContent });
 
+  // Fresh context (newDevicePage): storage is already empty, so one
+  // navigation is the clean boot — no wipe + reload.
   await pageA.goto('/');
-  await pageA.evaluate(async () => {
-    if (typeof (window as any /* eslint-disable-line @typescript-eslint/no-explicit-any */).__DISCONNECT_YJS__ === 'function') {
-      await (window as any /* eslint-disable-line @typescript-eslint/no-explicit-any */).__DISCONNECT_YJS__();
-    }
-    if (typeof (window as any /* eslint-disable-line @typescript-eslint/no-explicit-any */).__CLOSE_DB__ === 'function') {
-      await (window as any /* eslint-disable-line @typescript-eslint/no-explicit-any */).__CLOSE_DB__();
-    }
-    const dbs = await window.indexedDB.databases();
-    for (const db of dbs) {
-      if (db.name) {
-        await new Promise<void>((resolve) => {
-          const req = window.indexedDB.deleteDatabase(db.name!);
-          req.onsuccess = () => resolve();
-          req.onerror = () => resolve();
-          req.onblocked = () => resolve();
-        });
-      }
-    }
-    localStorage.clear();
-  });
-  await pageA.reload();
 
   await expect(pageA.getByTestId('library-view')).toBeVisible({ timeout: 15000 });
 
@@ -303,32 +244,13 @@ test('Offload Status Hydration', async ({ browser }) => {
   const mockDataStr = await pageA.evaluate(() => localStorage.getItem('versicle_mock_firestore_snapshot'));
   expect(mockDataStr).toBeTruthy();
 
-  await pageA.close();
-  await contextA.close();
+  await pageA.context().close();
 
-  const contextB = await browser.newContext({
-    viewport: { width: 1280, height: 720 }
+  const pageB = await newDevicePage({
+    contextOptions: DESKTOP,
+    initScript: 'window.__VERSICLE_MOCK_FIRESTORE__ = true;',
   });
-  const pageB = await contextB.newPage();
-
-  await pageB.addInitScript({ content: 'window.__VERSICLE_MOCK_FIRESTORE__ = true;' });
-  await pageB.addInitScript({ content: 'window.__VERSICLE_SANITIZATION_DISABLED__ = true;' });
-  await pageB.addInitScript({ content: `localStorage.setItem('versicle_mock_firestore_snapshot', ${JSON.stringify(mockDataStr)});` });
-
-  const snapshotDict = JSON.parse(mockDataStr!);
-  const pathKey = Object.keys(snapshotDict).find((k) => k.includes('/versicle/ws_'));
-  if (pathKey) {
-    const workspaceId = pathKey.split('/').pop();
-    await pageB.addInitScript({ content: `
-      localStorage.setItem('__VERSICLE_WORKSPACES__', JSON.stringify([{
-        workspaceId: '${workspaceId}',
-        name: 'My Library',
-        createdAt: Date.now(),
-        schemaVersion: 5
-      }]));
-    `});
-  }
-  await pageB.addInitScript({ content: ttsPolyfillContent });
+  await seedMockSnapshot(pageB, mockDataStr!);
 
   await pageB.goto('/');
   await expect(pageB.getByTestId('library-view')).toBeVisible({ timeout: 15000 });
@@ -363,25 +285,13 @@ test('Offload Status Hydration', async ({ browser }) => {
 
   const offloadIndicator = pageB.locator('.bg-black\\/20');
   await expect(offloadIndicator).toBeVisible({ timeout: 5000 });
-
-  await pageB.close();
-  await contextB.close();
 });
 
-test('Offline Resilience Test', async ({ browser }) => {
-  const context = await browser.newContext({
-    viewport: { width: 1280, height: 720 }
+test('Offline Resilience Test', async ({ newDevicePage }) => {
+  const page = await newDevicePage({
+    contextOptions: DESKTOP,
+    initScript: 'window.__VERSICLE_MOCK_FIRESTORE__ = true;',
   });
-  const page = await context.newPage();
-
-  const ttsPolyfillPath = path.resolve(__dirname, 'tts-polyfill.js');
-  const ttsPolyfillContent = fs.readFileSync(ttsPolyfillPath, 'utf8');
-
-  await page.addInitScript({ content: `
-    window.__VERSICLE_MOCK_FIRESTORE__ = true;
-    window.__VERSICLE_SANITIZATION_DISABLED__ = true;
-  `});
-  await page.addInitScript({ content: ttsPolyfillContent });
 
   await page.goto('/');
   await expect(page.getByTestId('library-view')).toBeVisible({ timeout: 15000 });
@@ -414,7 +324,4 @@ test('Offline Resilience Test', async ({ browser }) => {
 
   await expect(page.getByText('OfflineTest')).toBeVisible({ timeout: 5000 });
   await expect(page.getByText('OfflineReplacement')).toBeVisible();
-
-  await page.close();
-  await context.close();
 });
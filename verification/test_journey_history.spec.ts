@@ -1,32 +1,36 @@
-import { test, expect } from './utils';
+import { test, expect, waitForReaderReady, captureScreenshot, blockThirdPartyRequests } from './utils';
+import type { Page } from '@playwright/test';
+
+const currentCfi = (page: Page) => page.evaluate(() => window.__versicleTest?.reader?.currentCfi?.() ?? null);
 
 test('Reading History Journey Test', async ({ page }) => {
   // 1. Load the app (using the demo book since library might be empty)
+  await blockThirdPartyRequests(page);
   await page.goto('/');
 
-  // Wait for either reader view, book cards, or empty library message
-  for (let i = 0; i < 100; i++) {
-    if (await page.isVisible("[data-testid='reader-view']")) {
-      break;
-    }
-    if (await page.isVisible('text=Your library is empty')) {
-      await page.click('text=Load Demo Book');
-      await page.waitForSelector("[data-testid^='book-card-']", { timeout: 10000 });
-      await page.click("[data-testid^='book-card-']:first-child");
-      break;
-    }
-    if (await page.isVisible("[data-testid^='book-card-']")) {
-      await page.click("[data-testid^='book-card-']:first-child");
-      break;
-    }
-    await page.waitForTimeout(200);
+  // Wait for whichever boot state appears first instead of polling each probe
+  // on a 200ms sleep.
+  const readerView = page.locator("[data-testid='reader-view']");
+  const emptyLibrary = page.getByTestId('empty-library');
+  const bookCard = page.locator("[data-testid^='book-card-']");
+  await readerView.or(emptyLibrary).or(bookCard).first().waitFor({ timeout: 20000 });
+  if (await emptyLibrary.isVisible()) {
+    await page.getByTestId('load-demo-button').click();
+    await bookCard.first().waitFor({ timeout: 10000 });
+  }
+  if (!(await readerView.isVisible())) {
+    await bookCard.first().click();
   }
 
-  // Wait for reader to load
+  // Wait for reader to load and render its first location
   await page.waitForSelector("[data-testid='reader-view']", { timeout: 15000 });
+  await waitForReaderReady(page);
 
-  // DWELL TIME CHECK: We must stay on the initial page for > 2 seconds for history to track it
-  await page.waitForTimeout(3000);
+  // DWELL TIME CHECK: history only records a page after > 2s of dwell. Fake the
+  // clock and jump it forward rather than sleeping through the threshold in
+  // real time (same approach as test_event_history.spec.ts).
+  await page.clock.install();
+  await page.clock.fastForward(3000);
 
   // 2. Open Table of Contents
   await page.click("[data-testid='reader-toc-button']");
@@ -39,10 +43,12 @@ test('Reading History Journey Test', async ({ page }) => {
   await page.waitForSelector("[data-testid^='toc-item-']", { timeout: 5000 });
 
   // Click a different chapter than current to ensure navigation
+  const startCfi = await currentCfi(page);
   await page.click("[data-testid='toc-item-2']");
 
-  // Wait for navigation to complete and wait for dwell time (2s)
-  await page.waitForTimeout(3000);
+  // Wait for navigation to complete, then jump past the dwell time (2s)
+  await page.waitForFunction((cfi) => window.__versicleTest?.reader?.currentCfi?.() !== cfi, startCfi);
+  await page.clock.fastForward(3000);
 
   // 5. Check History again
   await page.click("[data-testid='reader-toc-button']");
@@ -63,13 +69,14 @@ test('Reading History Journey Test', async ({ page }) => {
   expect(subLabel).toContain('•');
 
   // Take a screenshot for verification
-  await page.screenshot({ path: 'verification/screenshots/history_with_date.png' });
+  await captureScreenshot(page, 'history_with_date');
 
   // 6. Click the history item to navigate back
+  const chapterCfi = await currentCfi(page);
   await historyItem.click();
 
   // Wait for navigation
-  await page.waitForTimeout(2000);
+  await page.waitForFunction((cfi) => window.__versicleTest?.reader?.currentCfi?.() !== cfi, chapterCfi);
 
   // Verify that the history panel (sidebar) is still open
   await expect(page.locator("[data-testid='reader-toc-sidebar']")).toBeVisible();
@@ -34,25 +34,21 @@ type PausePoint = "swap:staged" | "swap:before-apply" | "swap:mid-apply";
 async function openAppPage(context: BrowserContext, pause?: PausePoint): Promise<Page> {
   const page = await context.newPage();
   page.setDefaultTimeout(15000);
+  page.setDefaultNavigationTimeout(15000);
   await page.addInitScript(
     `window.__VERSICLE_MOCK_FIRESTORE__ = true;` +
       `window.__VERSICLE_FIRESTORE_DEBOUNCE_MS__ = 50;` +
       (pause ? `window.__VERSICLE_SWAP_PAUSE__ = ${JSON.stringify(pause)};` : "")
   );
   await page.goto("/");
-  // Bypass the intro dialog if it appears.
-  try {
-    await page.getByRole("button", { name: "Continue" }).click({ timeout: 2000 });
-  } catch {
-    // Ignore
-  }
   return page;
 }
 
 async function openSyncSettings(page: Page): Promise<void> {
   await page.getByTestId("header-settings-button").click();
-  await page.getByRole("tab", { name: "Sync & Cloud" }).scrollIntoViewIfNeeded().catch(() => {});
-  await page.getByRole("tab", { name: "Sync & Cloud" }).click();
+  const syncTab = page.getByRole("tab", { name: "Sync & Cloud" });
+  await syncTab.scrollIntoViewIfNeeded().catch(() => {});
+  await syncTab.click();
 }
 
 const readMigrationStatus = (page: Page): Promise<string | null> =>
@@ -70,11 +66,6 @@ test("journey kill-mid-switch: every crash window resumes; rollback restores the
   // ── Setup: mock sync, a non-empty library, and a second workspace ───────
   await page.addInitScript("window.__VERSICLE_MOCK_FIRESTORE__ = true; window.__VERSICLE_FIRESTORE_DEBOUNCE_MS__ = 50;");
   await page.goto("/");
-  try {
-    await page.getByRole("button", { name: "Continue" }).click({ timeout: 2000 });
-  } catch {
-    // Ignore
-  }
 
   // Library non-empty: the demo book is the journey's data canary.
   const loadBtn = page.getByRole("button", { name: "Load Demo Book" });
@@ -1,10 +1,11 @@
 import { test, expect } from './utils';
 import * as utils from './utils';
 
+test.use({ storageState: utils.LIBRARY_STATE });
+
 test('Journey Lexicon Test', async ({ page }) => {
   console.log('Starting Lexicon Journey...');
-  await utils.resetApp(page);
-  await utils.ensureLibraryWithBook(page);
+  await utils.openSeededLibrary(page);
 
   // Open Book
   console.log('Opening book...');
@@ -12,7 +13,7 @@ test('Journey Lexicon Test', async ({ page }) => {
   await expect(page).toHaveURL(/.*\/read\/.*/);
 
   // Wait for book to load
-  await page.waitForTimeout(2000);
+  await utils.waitForReaderReady(page);
 
   // Open Audio Deck and switch to its Settings view.
   // The deck is a right-side Radix Sheet; its "Settings" footer tab
@@ -118,7 +119,7 @@ test('Journey Lexicon Test', async ({ page }) => {
 
   // Close Dialog
   console.log('Closing Lexicon...');
-  await page.getByRole('button', { name: 'Close' }).last().click();
+  await page.getByTestId('lexicon-close-btn').click();
 
   await expect(page.getByRole('heading', { name: 'Pronunciation Lexicon', exact: true })).not.toBeVisible();
 
@@ -25,7 +25,7 @@ test('Library Grid/List Toggle', async ({ page }) => {
 
   // The second upload (import + IDB writes) can be slow on WebKit under full-suite load,
   // so allow extra time for the second card to render.
-  await expect(page.locator("[data-testid^='book-card-']")).toHaveCount(2, { timeout: 30000 });
+  await expect(page.locator("[data-testid^='book-card-']")).toHaveCount(2, { timeout: utils.INGEST_TIMEOUT });
 
   await utils.captureScreenshot(page, 'library_view_1_grid_initial');
 
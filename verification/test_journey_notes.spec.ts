@@ -1,10 +1,12 @@
 import { test, expect } from './utils';
 import * as utils from './utils';
 
+test.use({ storageState: utils.LIBRARY_STATE });
+
 test('Journey Notes Test', async ({ page }) => {
   console.log('Starting Global Notes Journey...');
-  await utils.resetApp(page);
-  await utils.ensureLibraryWithBook(page);
+  await utils.blockDecorativeAssets(page);
+  await utils.openSeededLibrary(page);
 
   // 1. Switch to Notes View
   console.log('Switching to Notes View...');
@@ -97,9 +99,11 @@ test('Journey Notes Test', async ({ page }) => {
   await expect(page.getByTestId('global-notes-view')).toBeVisible();
 
   // Check that book block is present
-  await expect(page.locator("[data-testid='book-notes-block']")).toBeVisible();
-  await expect(page.locator("[data-testid='book-notes-block']").getByText("Alice's Adventures in Wonderland").first()).toBeVisible();
-  await expect(page.locator("[data-testid='book-notes-block']").getByText('This is my insightful note.').first()).toBeVisible();
+  await Promise.all([
+    expect(page.locator("[data-testid='book-notes-block']")).toBeVisible(),
+    expect(page.locator("[data-testid='book-notes-block']").getByText("Alice's Adventures in Wonderland").first()).toBeVisible(),
+    expect(page.locator("[data-testid='book-notes-block']").getByText('This is my insightful note.').first()).toBeVisible(),
+  ]);
 
   // Check search functionality
   console.log('Testing Search...');
@@ -1,5 +1,5 @@
 import { test, expect } from "./utils";
-import { resetApp, captureScreenshot, ensureLibraryWithBook, navigateToChapter } from "./utils";
+import { resetApp, captureScreenshot, ensureLibraryWithBook, navigateToChapter, becomesVisible } from "./utils";
 
 test("verify progress bar", async ({ page }) => {
   // 1. Reset app to ensure clean state
@@ -36,12 +36,12 @@ test("verify progress bar", async ({ page }) => {
   await page.waitForTimeout(1000);
 
   // Go back to library
-  let backBtn = page.locator('button[aria-label="Back to Library"]');
-  if (!(await backBtn.isVisible())) {
-    backBtn = page.getByTestId("reader-back-button");
-  }
+  const backBtn = page
+    .locator('button[aria-label="Back to Library"]')
+    .or(page.getByTestId("reader-back-button"))
+    .first();
 
-  if (await backBtn.isVisible()) {
+  if (await becomesVisible(backBtn)) {
     await backBtn.click();
   } else {
     // Fallback: navigate via URL
@@ -16,6 +16,7 @@ import * as utils from './utils';
  */
 
 test('Opening Settings from the reader keeps the "This Book" lexicon scope', async ({ page }) => {
+  await utils.blockDecorativeAssets(page);
   await utils.resetApp(page);
   await utils.ensureLibraryWithBook(page);
 
@@ -49,6 +50,7 @@ test('Opening Settings from the reader keeps the "This Book" lexicon scope', asy
 });
 
 test('A per-rule language selection persists across a dialog reopen', async ({ page }) => {
+  await utils.blockDecorativeAssets(page);
   await utils.resetApp(page);
   await utils.ensureLibraryWithBook(page);
 
@@ -1,10 +1,12 @@
 import { test, expect } from "./utils";
-import { resetApp, ensureLibraryWithBook, captureScreenshot, navigateToChapter, getReaderFrame } from "./utils";
+import { openSeededLibrary, blockThirdPartyRequests, captureScreenshot, navigateToChapter, getReaderFrame, waitForReaderReady, LIBRARY_STATE } from "./utils";
+
+test.use({ storageState: LIBRARY_STATE });
 
 test("reading journey", async ({ page }) => {
   console.log("Starting Reading Journey...");
-  await resetApp(page);
-  await ensureLibraryWithBook(page);
+  await blockThirdPartyRequests(page);
+  await openSeededLibrary(page);
 
   // Open Book
   console.log("Opening book...");
@@ -13,7 +15,7 @@ test("reading journey", async ({ page }) => {
   await expect(page.getByTestId("reader-back-button")).toBeVisible();
 
   // Wait for content to render
-  await page.waitForTimeout(2000);
+  await waitForReaderReady(page);
   await captureScreenshot(page, "reading_01_initial_cover");
 
   // Navigate to a middle chapter immediately to ensure we have text
@@ -87,8 +89,10 @@ test("reading journey", async ({ page }) => {
   // Verify Compass Pill Accessibility
   console.log("Verifying Compass Pill Accessibility...");
   const activePill = page.getByTestId("compass-active-toggle");
-  await expect(activePill).toHaveAttribute("role", "button");
-  await expect(activePill).toHaveAttribute("tabindex", "0");
+  await Promise.all([
+    expect(activePill).toHaveAttribute("role", "button"),
+    expect(activePill).toHaveAttribute("tabindex", "0"),
+  ]);
 
   await activePill.focus();
   await captureScreenshot(page, "reading_01_compass_pill_focus");
@@ -1,5 +1,5 @@
 import { test, expect } from "./utils";
-import { resetApp, captureScreenshot } from "./utils";
+import { resetApp, captureScreenshot, waitForReaderReady } from "./utils";
 
 test("reading list journey", async ({ page }) => {
   console.log("Starting Reading List Journey...");
@@ -19,7 +19,7 @@ test("reading list journey", async ({ page }) => {
 
   // Advance a page to record progress
   console.log("Reading...");
-  await page.waitForTimeout(2000);
+  await waitForReaderReady(page);
   await page.keyboard.press("ArrowRight");
   // Wait for debounce save (1s) + margin
   await page.waitForTimeout(2000);
@@ -31,8 +31,9 @@ test("reading list journey", async ({ page }) => {
   // 4. Open Settings -> Data Management -> View List
   console.log("Opening Reading List...");
   await page.getByTestId("header-settings-button").click();
-  await page.getByRole("tab", { name: "Data Management" }).scrollIntoViewIfNeeded().catch(() => {});
-  await page.getByRole("tab", { name: "Data Management" }).click();
+  const dataTab = page.getByRole("tab", { name: "Data Management" });
+  await dataTab.scrollIntoViewIfNeeded().catch(() => {});
+  await dataTab.click();
   await page.getByRole("button", { name: "View List" }).click();
 
   // 5. Verify Entry
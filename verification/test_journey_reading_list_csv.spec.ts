@@ -30,24 +30,20 @@ test("reading list csv journey", async ({ page }) => {
   // 2. Open settings, go to data management, and download the reading list
   console.log("Opening Settings -> Data Management...");
   await page.getByTestId("header-settings-button").click();
-  await page.getByRole("tab", { name: "Data Management" }).scrollIntoViewIfNeeded().catch(() => {});
-  await page.getByRole("tab", { name: "Data Management" }).click();
+  const dataTab = page.getByRole("tab", { name: "Data Management" });
+  await dataTab.scrollIntoViewIfNeeded().catch(() => {});
+  await dataTab.click();
 
   console.log("Downloading Reading List...");
   const downloadPromise = page.waitForEvent("download");
   await page.getByRole("button", { name: "Export to CSV" }).click();
   const download = await downloadPromise;
 
-  const downloadPath = path.resolve(__dirname, "downloaded_reading_list.csv");
-  if (fs.existsSync(downloadPath)) {
-    fs.unlinkSync(downloadPath);
-  }
-  await download.saveAs(downloadPath);
-  console.log(`Downloaded to ${downloadPath}`);
-
-  // 3. Verify that the downloaded reading list contains Alice in wonderland
+  // 3. Verify that the downloaded reading list contains Alice in wonderland.
+  // Read Playwright's own download artifact (removed with the context)
+  // rather than copying it next to the specs first.
   console.log("Verifying content...");
-  const csvContent = fs.readFileSync(downloadPath, "utf8");
+  const csvContent = fs.readFileSync(await download.path(), "utf8");
   const lines = csvContent.split(/\r?\n/).filter(line => line.trim() !== "");
 
   if (lines.length === 0) {
@@ -84,13 +80,13 @@ test("reading list csv journey", async ({ page }) => {
   rowCells[percentIdx] = "0.5";
   lines[aliceRowIndex] = rowCells.join(",");
 
-  const modifiedPath = path.resolve(__dirname, "modified_reading_list.csv");
-  fs.writeFileSync(modifiedPath, lines.join("\n"), "utf8");
-  console.log(`Saved modified CSV to ${modifiedPath}`);
-
-  // 5. In the settings, import the reading list
+  // 5. In the settings, import the reading list (uploaded from memory)
   console.log("Importing modified Reading List...");
-  await page.getByTestId("reading-list-csv-input").setInputFiles(modifiedPath);
+  await page.getByTestId("reading-list-csv-input").setInputFiles({
+    name: "modified_reading_list.csv",
+    mimeType: "text/csv",
+    buffer: Buffer.from(lines.join("\n"), "utf8"),
+  });
 
   // Wait for completion message
   await expect(page.getByText("Import Complete", { exact: true })).toBeVisible({ timeout: 10000 });
@@ -110,12 +106,4 @@ test("reading list csv journey", async ({ page }) => {
 
   await captureScreenshot(page, "reading_list_csv_success");
   console.log("Reading List CSV Journey Passed!");
-
-  // Cleanup
-  if (fs.existsSync(downloadPath)) {
-    fs.unlinkSync(downloadPath);
-  }
-  if (fs.existsSync(modifiedPath)) {
-    fs.unlinkSync(modifiedPath);
-  }
 });
@@ -1,17 +1,15 @@
-import { test, expect } from "./utils";
+import { test, expect, becomesVisible, blockDecorativeAssets } from "./utils";
 
 test("recovery flow", async ({ page }) => {
+  await blockDecorativeAssets(page);
   // 1. Open App
   console.log("Opening App...");
   await page.goto("http://localhost:5173");
 
-  // Wait for app to load
-  await page.waitForTimeout(3000);
-
   // 2. Open Settings
   console.log("Opening Settings...");
   const settingsBtn = page.getByRole("button", { name: "Settings" });
-  if (!(await settingsBtn.isVisible())) {
+  if (!(await becomesVisible(settingsBtn, 10000))) {
     console.log("Settings button not found. Dumping accessible buttons:");
     const buttons = await page.getByRole("button").all();
     for (const btn of buttons) {
@@ -34,10 +32,7 @@ test("recovery flow", async ({ page }) => {
   await expect(createBtn).toBeVisible();
   await createBtn.click();
 
-  // Wait for toast or list update
-  await page.waitForTimeout(2000);
-
-  // 5. Verify Snapshot in List
+  // 5. Verify Snapshot in List (the list refreshes once the snapshot is written)
   console.log("Verifying Snapshot...");
   const manualBadge = page.getByText("manual").first();
   await expect(manualBadge).toBeVisible();
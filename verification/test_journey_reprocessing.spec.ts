@@ -1,5 +1,5 @@
 import { test, expect } from "./utils";
-import { ensureLibraryWithBook, captureScreenshot, resetApp, waitForPersistedWrites } from "./utils";
+import { ensureLibraryWithBook, captureScreenshot, resetApp, waitForPersistedWrites, blockThirdPartyRequests } from "./utils";
 
 test("verify reprocessing interstitial", async ({ page }) => {
   // Re-enabled on WebKit. The earlier "pathologically slow / never returns" symptom was not
@@ -9,6 +9,7 @@ test("verify reprocessing interstitial", async ({ page }) => {
   // give the whole test extra headroom beyond the project default
   test.setTimeout(240000);
   // 1. Reset app using utility
+  await blockThirdPartyRequests(page);
   await resetApp(page);
 
   // 2. Ensure we have the demo book using utility
@@ -16,63 +17,54 @@ test("verify reprocessing interstitial", async ({ page }) => {
 
   // 3. Find the book ID and downgrade version
   const bookTitle = "Alice's Adventures in Wonderland";
-  let bookId: string | null = null;
-
-  // Retry loop for DB persistence
-  for (let i = 0; i < 10; i++) {
-    bookId = await page.evaluate((title) => {
-      return new Promise<string | null>((resolve) => {
-        const req = indexedDB.open("EpubLibraryDB");
-        req.onsuccess = (e: any /* eslint-disable-line @typescript-eslint/no-explicit-any */) => {
-          const db = e.target.result;
-          console.log("IndexedDB EpubLibraryDB opened successfully. Object stores:", Array.from(db.objectStoreNames));
-          if (!db.objectStoreNames.contains("static_manifests")) {
-            resolve(null);
-            return;
-          }
-          const tx = db.transaction("static_manifests", "readonly");
-          const store = tx.objectStore("static_manifests");
-          store.getAll().onsuccess = (ev: any /* eslint-disable-line @typescript-eslint/no-explicit-any */) => {
-            const manifests = ev.target.result;
-            console.log("All manifests in DB:", manifests.map((m: any /* eslint-disable-line @typescript-eslint/no-explicit-any */) => m.title));
-            const manifest = manifests.find((m: any /* eslint-disable-line @typescript-eslint/no-explicit-any */) => m.title.includes(title));
-            resolve(manifest ? manifest.bookId : null);
-          };
-        };
-        req.onerror = (err) => {
-          console.error("Failed to open EpubLibraryDB:", err);
-          resolve(null);
-        };
-      });
-    }, bookTitle);
-
-    if (bookId) {
-      break;
-    }
-    await page.waitForTimeout(500);
-  }
-
-  console.log(`Found book ID: ${bookId}`);
-  if (!bookId) {
-    throw new Error("Could not find demo book ID in DB after loading");
-  }
-
-  // Update the book version to 0
-  await page.evaluate((id) => {
-    return new Promise<boolean>((resolve) => {
+  // Lookup and downgrade share ONE readwrite transaction (one IDB open, one
+  // page round-trip). expect.poll retries on a short backoff until the
+  // manifest has been persisted, instead of sleeping 500ms per miss.
+  const downgradeBook = () => page.evaluate((title) => {
+    return new Promise<string | null>((resolve) => {
       const req = indexedDB.open("EpubLibraryDB");
       req.onsuccess = (e: any /* eslint-disable-line @typescript-eslint/no-explicit-any */) => {
         const db = e.target.result;
+        if (!db.objectStoreNames.contains("static_manifests")) {
+          db.close();
+          resolve(null);
+          return;
+        }
         const tx = db.transaction("static_manifests", "readwrite");
         const store = tx.objectStore("static_manifests");
-        store.get(id).onsuccess = (ev: any /* eslint-disable-line @typescript-eslint/no-explicit-any */) => {
-          const manifest = ev.target.result;
+        let bookId: string | null = null;
+        store.getAll().onsuccess = (ev: any /* eslint-disable-line @typescript-eslint/no-explicit-any */) => {
+          const manifest = ev.target.result.find((m: any /* eslint-disable-line @typescript-eslint/no-explicit-any */) => m.title.includes(title));
+          if (!manifest) return;
           manifest.schemaVersion = 0;
-          store.put(manifest).onsuccess = () => resolve(true);
+          store.put(manifest);
+          bookId = manifest.bookId;
+        };
+        tx.oncomplete = () => {
+          db.close();
+          resolve(bookId);
+        };
+        tx.onerror = () => {
+          db.close();
+          resolve(null);
         };
       };
+      req.onerror = (err) => {
+        console.error("Failed to open EpubLibraryDB:", err);
+        resolve(null);
+      };
     });
-  }, bookId);
+  }, bookTitle);
+
+  // (asserted, not annotated: the poll callback assigns it, which TS's
+  // narrowing of a `= null` initializer would not see)
+  let bookId = null as string | null;
+  await expect.poll(async () => (bookId = await downgradeBook()), { timeout: 5000 }).not.toBeNull();
+
+  console.log(`Found book ID: ${bookId}`);
+  if (!bookId) {
+    throw new Error("Could not find demo book ID in DB after loading");
+  }
 
   console.log("Downgraded book version to 0.");
 
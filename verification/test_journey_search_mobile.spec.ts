@@ -1,5 +1,5 @@
 import { test, expect } from "./utils";
-import { resetApp, captureScreenshot } from "./utils";
+import { resetApp, captureScreenshot, becomesVisible } from "./utils";
 
 test("search and sort mobile", async ({ page }) => {
   console.log("Starting Search and Sort User Journey (Mobile)...");
@@ -11,10 +11,10 @@ test("search and sort mobile", async ({ page }) => {
 
   // 1. Populate Library
   console.log("- Populating Library...");
-  const loadBtn = page.getByText("Load Demo Book");
-  if (await loadBtn.isVisible()) {
+  const loadBtn = page.getByTestId("load-demo-button");
+  if (await becomesVisible(loadBtn)) {
     await loadBtn.click();
-    await expect(page.getByText("Alice's Adventures in Wonderland").first()).toBeVisible({ timeout: 10000 });
+    await expect(page.locator("[data-testid^='book-card-']").first()).toBeVisible({ timeout: 10000 });
   }
 
   // 2. Search Functionality
@@ -1,5 +1,5 @@
 import { test, expect } from "./utils";
-import { resetApp, ensureLibraryWithBook, captureScreenshot, openAudioSettings } from "./utils";
+import { resetApp, ensureLibraryWithBook, captureScreenshot, openAudioSettings, waitForReaderReady } from "./utils";
 
 test("settings persistence", async ({ page }) => {
   console.log("Starting Settings Persistence Journey...");
@@ -9,7 +9,7 @@ test("settings persistence", async ({ page }) => {
   // Open Book
   await page.locator("[data-testid^='book-card-']").first().click();
   await expect(page).toHaveURL(/.*\/read\/.*/);
-  await page.waitForTimeout(2000);
+  await waitForReaderReady(page);
 
   // 1. Open Audio Panel and switch to its Settings view.
   // The audio deck is a right-side Radix Sheet; its "Settings" footer tab
@@ -42,7 +42,7 @@ test("settings persistence", async ({ page }) => {
   // 3. Reload
   console.log("Reloading...");
   await page.reload();
-  await page.waitForTimeout(2000);
+  await waitForReaderReady(page);
 
   // 4. Verify Persistence
   console.log("Verifying Persistence...");
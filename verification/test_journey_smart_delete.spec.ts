@@ -15,8 +15,11 @@ test("smart delete journey", async ({ page }) => {
   console.log("Importing book...");
   await page.getByTestId("hidden-file-input").setInputFiles(demoEpubPath);
 
-  // Wait for book to appear
+  // Wait for book to appear. Locators are lazy (re-resolved on every action),
+  // so build each one once and reuse it — even across the reload-free
+  // offload/restore round-trip below.
   const bookCard = page.locator("[data-testid^='book-card-']").first();
+  const offloadedOverlay = page.getByTestId("offloaded-overlay");
   await expect(bookCard).toBeVisible({ timeout: 20000 });
 
   // 2. Offload Book
@@ -34,10 +37,10 @@ test("smart delete journey", async ({ page }) => {
   const confirmBtn = page.getByTestId("confirm-offload");
   await expect(confirmBtn).toHaveCount(1);
   // Use JS click to bypass potential obstructions
-  await page.evaluate("document.querySelector('[data-testid=\"confirm-offload\"]').click()");
+  await confirmBtn.evaluate((el: HTMLElement) => el.click());
 
   // 3. Verify Offloaded State
-  await expect(page.getByTestId("offloaded-overlay")).toBeVisible({ timeout: 5000 });
+  await expect(offloadedOverlay).toBeVisible({ timeout: 5000 });
 
   // Wait a moment for state update
   await page.waitForTimeout(1000);
@@ -58,7 +61,7 @@ test("smart delete journey", async ({ page }) => {
   await fileChooser.setFiles(demoEpubPath);
 
   // Wait for restore to complete (loader or just state change)
-  await expect(page.getByTestId("offloaded-overlay")).not.toBeVisible({ timeout: 5000 });
+  await expect(offloadedOverlay).not.toBeVisible({ timeout: 5000 });
 
   await captureScreenshot(page, "library_smart_delete_restored");
 
@@ -67,14 +70,14 @@ test("smart delete journey", async ({ page }) => {
   await page.waitForTimeout(3000);
 
   // Verify the book cover image no longer has the grayscale class (skip if no img, e.g. WebKit with no SW)
-  const bookCoverImg = page.locator("[data-testid^='book-card-']").first().locator("img").first();
+  const bookCoverImg = bookCard.locator("img").first();
   if (await bookCoverImg.count() > 0) {
     await expect(bookCoverImg).not.toHaveClass(/.*grayscale.*/, { timeout: 5000 });
   }
 
-  // Use a fresh locator to avoid any stale reference issues
-  const freshBookCard = page.locator("[data-testid^='book-card-']").first();
-  await freshBookCard.click();
+  // No "fresh" locator needed: a Locator is a query, not an element handle,
+  // so it cannot go stale.
+  await bookCard.click();
 
   const reprocessingModal = page.getByText("Upgrading Book...");
   await page.waitForTimeout(500);
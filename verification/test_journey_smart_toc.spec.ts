@@ -1,17 +1,14 @@
 import { test, expect } from "./utils";
-import { resetApp, ensureLibraryWithBook } from "./utils";
-import * as fs from "fs";
-import * as path from "path";
-import { fileURLToPath } from "url";
+import { openSeededLibrary, captureScreenshot, LIBRARY_STATE } from "./utils";
 
-const __filename = fileURLToPath(import.meta.url);
-const __dirname = path.dirname(__filename);
+// The reloads below keep the seeded IndexedDB, so the book card is always
+// there to click.
+test.use({ storageState: LIBRARY_STATE });
 
 test("smart toc success", async ({ page }) => {
   console.log("Starting Smart TOC Success Journey...");
-  // 1. Reset and Load
-  await resetApp(page);
-  await ensureLibraryWithBook(page);
+  // 1. Open the seeded library
+  await openSeededLibrary(page);
 
   // 2. Inject Mock Data for GenAI
   // We use real IDs from Alice in Wonderland (np-4 is Chapter 1)
@@ -44,15 +41,6 @@ test("smart toc success", async ({ page }) => {
   }, mockResponse);
 
   // 3. Open Reader
-  // Ensure book is present (reload might have cleared state or DB latency)
-  try {
-    await page.locator('[data-testid^="book-card-"]').first().waitFor({ timeout: 10000 });
-  } catch {
-    console.log("Book card missing after reload in Success Scenario, ensuring library again...");
-    await ensureLibraryWithBook(page);
-    await page.locator('[data-testid^="book-card-"]').first().waitFor({ timeout: 30000 });
-  }
-
   await page.locator('[data-testid^="book-card-"]').first().click();
   await expect(page.getByTestId("reader-view")).toBeVisible({ timeout: 20000 });
 
@@ -67,8 +55,7 @@ test("smart toc success", async ({ page }) => {
   await page.locator("#synthetic-toc-mode").click();
 
   // Debug: capture UI state right after the switch click
-  const dbgSuffix = page.viewportSize()?.width && page.viewportSize()!.width < 600 ? "mobile" : "desktop";
-  await page.screenshot({ path: path.join(__dirname, `screenshots/debug_switch_click_success_${dbgSuffix}.png`) });
+  await captureScreenshot(page, "debug_switch_click_success");
 
   // Log DOM state for diagnosis
   const domState = await page.evaluate(() => {
@@ -104,20 +91,14 @@ test("smart toc success", async ({ page }) => {
   // Verify original title is GONE (or at least replaced in the list view)
   await expect(page.getByText("CHAPTER I. Down the Rabbit-Hole")).not.toBeVisible();
 
-  const screenshotsDir = path.resolve(__dirname, "screenshots");
-  if (!fs.existsSync(screenshotsDir)) {
-    fs.mkdirSync(screenshotsDir, { recursive: true });
-  }
-  const suffix = page.viewportSize()?.width && page.viewportSize()!.width < 600 ? "mobile" : "desktop";
-  await page.screenshot({ path: path.join(screenshotsDir, `smart_toc_success_${suffix}.png`) });
+  await captureScreenshot(page, "smart_toc_success");
 });
 
 test("smart toc failure", async ({ page }) => {
   console.log("Starting Smart TOC Failure Journey...");
 
   // Setup
-  await resetApp(page);
-  await ensureLibraryWithBook(page);
+  await openSeededLibrary(page);
 
   // 1. Missing Key Scenario
   console.log("--- Scenario 1: Missing Key ---");
@@ -132,15 +113,6 @@ test("smart toc failure", async ({ page }) => {
   });
   await page.reload();
 
-  // Ensure book is present (reload might have cleared state or DB latency)
-  try {
-    await page.locator('[data-testid^="book-card-"]').first().waitFor({ timeout: 10000 });
-  } catch {
-    console.log("Book card missing after reload, ensuring library again...");
-    await ensureLibraryWithBook(page);
-    await page.locator('[data-testid^="book-card-"]').first().waitFor({ timeout: 30000 });
-  }
-
   await page.locator('[data-testid^="book-card-"]').first().click();
   await expect(page.getByTestId("reader-view")).toBeVisible({ timeout: 20000 });
 
@@ -148,23 +120,16 @@ test("smart toc failure", async ({ page }) => {
   await expect(page.getByTestId("reader-toc-sidebar")).toBeVisible();
   await page.locator("#synthetic-toc-mode").click();
   // Debug: capture state after switch click in failure scenario
-  const failDbgSuffix = page.viewportSize()?.width && page.viewportSize()!.width < 600 ? "mobile" : "desktop";
-  await page.screenshot({ path: path.join(__dirname, `screenshots/debug_switch_click_fail_${failDbgSuffix}.png`) });
+  await captureScreenshot(page, "debug_switch_click_fail");
 
   await page.getByRole("button", { name: "Enhance Titles with AI" }).click();
 
-  const screenshotsDir = path.resolve(__dirname, "screenshots");
-  if (!fs.existsSync(screenshotsDir)) {
-    fs.mkdirSync(screenshotsDir, { recursive: true });
-  }
-  const suffix = page.viewportSize()?.width && page.viewportSize()!.width < 600 ? "mobile" : "desktop";
-
   // Expect error toast
   try {
     await expect(page.getByText("AI features are disabled or not configured")).toBeVisible({ timeout: 10000 });
   } catch (e) {
     console.log("Taking failure screenshot for Scenario 1...");
-    await page.screenshot({ path: path.join(screenshotsDir, `smart_toc_failure_sc1_${suffix}.png`) });
+    await captureScreenshot(page, "smart_toc_failure_sc1");
     throw e;
   }
 
@@ -187,7 +152,7 @@ test("smart toc failure", async ({ page }) => {
   try {
     await expect(page.getByTestId("reader-view")).toBeVisible({ timeout: 5000 });
   } catch {
-    await page.locator('[data-testid^="book-card-"]').first().waitFor({ timeout: 30000 });
+    await page.locator('[data-testid^="book-card-"]').first().waitFor();
     await page.locator('[data-testid^="book-card-"]').first().click();
     await expect(page.getByTestId("reader-view")).toBeVisible({ timeout: 20000 });
   }
@@ -218,9 +183,9 @@ test("smart toc failure", async ({ page }) => {
     await expect(page.getByText("Failed to enhance TOC")).toBeVisible({ timeout: 5000 });
   } catch (e) {
     console.log("Taking failure screenshot...");
-    await page.screenshot({ path: path.join(screenshotsDir, `smart_toc_failure_debug_${suffix}.png`) });
+    await captureScreenshot(page, "smart_toc_failure_debug");
     throw e;
   }
 
-  await page.screenshot({ path: path.join(screenshotsDir, `smart_toc_failure_${suffix}.png`) });
+  await captureScreenshot(page, "smart_toc_failure");
 });
@@ -1,5 +1,5 @@
 import type { Page } from '@playwright/test';
-import { test, expect, openSettings, gotoSettingsTab, closeSettings, waitForReaderReady } from "./utils";
+import { test, expect, openSettings, gotoSettingsTab, closeSettings, waitForReaderReady, screenshotPath } from "./utils";
 import * as fs from "fs";
 import * as path from "path";
 import { fileURLToPath } from "url";
@@ -8,20 +8,13 @@ import type { Frame } from "@playwright/test";
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
-// Read tts-polyfill.js content
-const ttsPolyfillPath = path.resolve(__dirname, 'tts-polyfill.js');
-const ttsPolyfillContent = fs.readFileSync(ttsPolyfillPath, 'utf8');
-
-function injectMockFirestore(page: Page, testUid: string) {
-  const injectionCode = `
+function mockFirestoreScript(testUid: string): string {
+  return `
     window.__VERSICLE_MOCK_FIRESTORE__ = true;
     window.__VERSICLE_MOCK_USER_ID__ = '${testUid}';
-    window.__VERSICLE_SANITIZATION_DISABLED__ = true;
     window.__VERSICLE_FIRESTORE_DEBOUNCE_MS__ = 20;
     window.__VERSICLE_MOCK_SYNC_DELAY__ = 10;
   `;
-  page.addInitScript({ content: injectionCode });
-  page.addInitScript({ content: ttsPolyfillContent });
 }
 
 function extractWorkspaceId(snapshot: unknown, testUid: string): string | null {
@@ -39,33 +32,10 @@ function extractWorkspaceId(snapshot: unknown, testUid: string): string | null {
   return null;
 }
 
-async function clearDataAndReload(page: Page, baseURL: string) {
+// Every device page comes from a fresh context (newDevicePage), so there is no
+// IndexedDB or localStorage to wipe: one navigation is the clean boot.
+async function openApp(page: Page, baseURL: string) {
   await page.goto(baseURL || "/");
-  await page.evaluate(async () => {
-    // Disconnect Yjs to release IDB locks
-    if (typeof (window as any /* eslint-disable-line @typescript-eslint/no-explicit-any */).__DISCONNECT_YJS__ === 'function') {
-      await (window as any /* eslint-disable-line @typescript-eslint/no-explicit-any */).__DISCONNECT_YJS__();
-    }
-
-    // Disconnect main DB connection to release IndexedDB locks
-    if (typeof (window as any /* eslint-disable-line @typescript-eslint/no-explicit-any */).__CLOSE_DB__ === 'function') {
-      await (window as any /* eslint-disable-line @typescript-eslint/no-explicit-any */).__CLOSE_DB__();
-    }
-
-    const dbs = await window.indexedDB.databases();
-    for (const db of dbs) {
-      if (db.name) {
-        await new Promise<void>(resolve => {
-          const req = window.indexedDB.deleteDatabase(db.name!);
-          req.onsuccess = () => resolve();
-          req.onerror = () => resolve();
-          req.onblocked = () => resolve();
-        });
-      }
-    }
-    localStorage.clear();
-  });
-  await page.reload();
   await expect(page.getByTestId("library-view")).toBeVisible({ timeout: 10000 });
 }
 
@@ -101,17 +71,14 @@ async function waitForReaderFrame(page: Page): Promise<Frame> {
   throw new Error("Timeout waiting for reader iframe");
 }
 
-test("seamless handoff", async ({ browser, baseURL }) => {
+test("seamless handoff", async ({ newDevicePage, baseURL }) => {
   const testUid = `mock-user-${Math.random().toString(36).substring(2, 10)}`;
   const finalBaseURL = baseURL || "http://localhost:5173";
 
   // --- Device A ---
   console.log("\n[A] Setting up...");
-  const contextA = await browser.newContext();
-  const pageA = await contextA.newPage();
-  pageA.on("console", (msg) => console.log(`[Page A] ${msg.text()}`));
-  injectMockFirestore(pageA, testUid);
-  await clearDataAndReload(pageA, finalBaseURL);
+  const pageA = await newDevicePage({ label: "Page A", initScript: mockFirestoreScript(testUid) });
+  await openApp(pageA, finalBaseURL);
 
   // Import
   const alicePath = path.resolve(__dirname, "alice.epub");
@@ -151,8 +118,9 @@ test("seamless handoff", async ({ browser, baseURL }) => {
     await pageA.getByTestId("reader-toc-button").click({ noWaitAfter: true });
     await pageA.waitForSelector('[data-testid="reader-toc-sidebar"]', { state: "visible", timeout: 8000 }).catch(() => {});
     await pageA.waitForSelector('[data-testid^="toc-item-"]', { state: "visible", timeout: 8000 }).catch(() => {});
-    await pageA.getByTestId("toc-item-6").scrollIntoViewIfNeeded().catch(() => {});
-    await pageA.getByTestId("toc-item-6").click({ force: true });
+    const tocItem = pageA.getByTestId("toc-item-6");
+    await tocItem.scrollIntoViewIfNeeded().catch(() => {});
+    await tocItem.click({ force: true });
     await expect(pageA.getByTestId("reader-toc-sidebar")).not.toBeVisible();
     await pageA.waitForTimeout(2000);
 
@@ -203,15 +171,11 @@ test("seamless handoff", async ({ browser, baseURL }) => {
   }
   console.log(`[A] Verified workspace ID: ${wsId}`);
 
-  await pageA.close();
-  await contextA.close();
+  await pageA.context().close();
 
   // --- Device B ---
   console.log("\n[B] Resuming...");
-  const contextB = await browser.newContext();
-  const pageB = await contextB.newPage();
-  pageB.on("console", (msg) => console.log(`[Page B] ${msg.text()}`));
-  injectMockFirestore(pageB, testUid);
+  const pageB = await newDevicePage({ label: "Page B", initScript: mockFirestoreScript(testUid) });
   await pageB.goto(finalBaseURL);
 
   // Set localStorage values on the correct origin securely
@@ -231,7 +195,7 @@ test("seamless handoff", async ({ browser, baseURL }) => {
   // Debug-only artifact: bound it and never let it fail the test. page.screenshot() hangs
   // indefinitely if it fires while the page is mid-navigation, and the post-switch flow
   // does a window.location.reload() followed by a client-side router nav before settling.
-  await pageB.screenshot({ path: path.join(__dirname, "screenshots", "handoff_B_initial.png"), timeout: 5000 }).catch(() => {});
+  await pageB.screenshot({ path: screenshotPath(pageB, "handoff_B_initial"), type: "jpeg", quality: 70, timeout: 5000 }).catch(() => {});
 
   console.log("[B] Selecting workspace to start sync...");
   // Settings is now a Radix-Tabs SettingsShell at /settings/:tab (Phase-10 overhaul);
@@ -250,7 +214,7 @@ test("seamless handoff", async ({ browser, baseURL }) => {
   await expect(pageB.getByTestId("library-view")).toBeVisible({ timeout: 30000 });
   console.log("[B] Workspace finalized and reloaded");
   // Debug-only artifact: bound it and never let it fail the test (see note above).
-  await pageB.screenshot({ path: path.join(__dirname, "screenshots", "handoff_B_synced.png"), timeout: 5000 }).catch(() => {});
+  await pageB.screenshot({ path: screenshotPath(pageB, "handoff_B_synced"), type: "jpeg", quality: 70, timeout: 5000 }).catch(() => {});
 
   // Wait for Ghost Book to appear
   const cardB = pageB.locator("[data-testid^='book-card-']").first();
@@ -334,19 +298,13 @@ test("seamless handoff", async ({ browser, baseURL }) => {
   // Check progress via UI Progress Bar
   const finalProgressBar = cardB.locator('[data-testid="progress-container"]');
   await expect(finalProgressBar).toBeVisible({ timeout: 10000 });
-
-  await pageB.close();
-  await contextB.close();
 });
 
-test("note marker affordance", async ({ browser, baseURL }) => {
+test("note marker affordance", async ({ newDevicePage, baseURL }) => {
   const testUid = `mock-user-${Math.random().toString(36).substring(2, 10)}`;
   const finalBaseURL = baseURL || "http://localhost:5173";
-  const context = await browser.newContext();
-  const page = await context.newPage();
-  page.on("console", (msg) => console.log(`[Page] ${msg.text()}`));
-  injectMockFirestore(page, testUid);
-  await clearDataAndReload(page, finalBaseURL);
+  const page = await newDevicePage({ label: "Page", initScript: mockFirestoreScript(testUid) });
+  await openApp(page, finalBaseURL);
 
   // Import book
   const alicePath = path.resolve(__dirname, "alice.epub");
@@ -369,8 +327,9 @@ test("note marker affordance", async ({ browser, baseURL }) => {
   await page.getByTestId("reader-toc-button").click({ noWaitAfter: true });
   await page.waitForSelector('[data-testid="reader-toc-sidebar"]', { state: "visible", timeout: 8000 }).catch(() => {});
   await page.waitForSelector('[data-testid^="toc-item-"]', { state: "visible", timeout: 8000 }).catch(() => {});
-  await page.getByTestId("toc-item-6").scrollIntoViewIfNeeded().catch(() => {});
-  await page.getByTestId("toc-item-6").click({ force: true });
+  const tocItem = page.getByTestId("toc-item-6");
+  await tocItem.scrollIntoViewIfNeeded().catch(() => {});
+  await tocItem.click({ force: true });
   await expect(page.getByTestId("reader-toc-sidebar")).not.toBeVisible();
   await page.waitForTimeout(1500);
 
@@ -436,21 +395,15 @@ test("note marker affordance", async ({ browser, baseURL }) => {
     styles.bg.includes("98.111") ||
     styles.bg.includes("oklch");
   expect(isYellow).toBe(true);
-
-  await page.close();
-  await context.close();
 });
 
-test("offline resilience", async ({ browser, baseURL }) => {
+test("offline resilience", async ({ newDevicePage, baseURL }) => {
   const testUid = `mock-user-${Math.random().toString(36).substring(2, 10)}`;
   const finalBaseURL = baseURL || "http://localhost:5173";
 
   // --- Device A ---
-  const contextA = await browser.newContext();
-  const pageA = await contextA.newPage();
-
-  injectMockFirestore(pageA, testUid);
-  await clearDataAndReload(pageA, finalBaseURL);
+  const pageA = await newDevicePage({ initScript: mockFirestoreScript(testUid) });
+  await openApp(pageA, finalBaseURL);
 
   // Add Lexicon Rule. Settings is now a Radix-Tabs SettingsShell (Phase-10);
   // the Dictionary panel's lexicon entry button is "Manage Rules".
@@ -477,14 +430,10 @@ test("offline resilience", async ({ browser, baseURL }) => {
   const finalSnapshot = await pageA.evaluate(() => localStorage.getItem('versicle_mock_firestore_snapshot'));
   const parsedSnapshot = JSON.parse(finalSnapshot!);
 
-  await pageA.close();
-  await contextA.close();
+  await pageA.context().close();
 
   // --- Device B ---
-  const contextB = await browser.newContext();
-  const pageB = await contextB.newPage();
-  pageB.on("console", (msg) => console.log(`[Page B] ${msg.text()}`));
-  injectMockFirestore(pageB, testUid);
+  const pageB = await newDevicePage({ label: "Page B", initScript: mockFirestoreScript(testUid) });
   await pageB.goto(finalBaseURL);
 
   const wsId = extractWorkspaceId(parsedSnapshot, testUid);
@@ -567,24 +516,19 @@ test("offline resilience", async ({ browser, baseURL }) => {
 
   if (!ruleVisible) {
     console.log("Rule not visible after wait. capturing screenshot...");
-    await pageB.screenshot({ path: path.join(__dirname, "screenshots", "sync_fail_mobile_debug.png") });
+    await pageB.screenshot({ path: screenshotPath(pageB, "sync_fail_debug"), type: "jpeg", quality: 70, timeout: 5000 }).catch(() => {});
     await expect(pageB.getByText("Offline")).toBeVisible({ timeout: 1000 });
   } else {
     console.log("Rule synced and visible!");
     await expect(pageB.getByText("Offline")).toBeVisible();
   }
-
-  await pageB.close();
-  await contextB.close();
 });
 
-test("data liberation", async ({ browser, baseURL }) => {
+test("data liberation", async ({ newDevicePage, baseURL }) => {
   const testUid = `mock-user-${Math.random().toString(36).substring(2, 10)}`;
   const finalBaseURL = baseURL || "http://localhost:5173";
-  const context = await browser.newContext();
-  const page = await context.newPage();
-  injectMockFirestore(page, testUid);
-  await clearDataAndReload(page, finalBaseURL);
+  const page = await newDevicePage({ initScript: mockFirestoreScript(testUid) });
+  await openApp(page, finalBaseURL);
 
   // Create some data via the new SettingsShell Dictionary tab.
   await openSettings(page);
@@ -620,11 +564,8 @@ test("data liberation", async ({ browser, baseURL }) => {
   await page.getByRole("button", { name: "Quick JSON Export" }).click({ force: true });
   const download = await downloadPromise;
 
-  const tempPath = path.resolve(__dirname, `export_${Math.random().toString(36).substring(2, 10)}.json`);
-  await download.saveAs(tempPath);
-
-  // Validate JSON
-  const fileContent = fs.readFileSync(tempPath, "utf8");
+  // Validate JSON straight from Playwright's download artifact
+  const fileContent = fs.readFileSync(await download.path(), "utf8");
   const data = JSON.parse(fileContent);
 
   // BACKUP_VERSION bumped to 3 in the Phase-10 overhaul (BackupService.ts); the v3
@@ -632,8 +573,4 @@ test("data liberation", async ({ browser, baseURL }) => {
   expect(data.version).toBe(3);
   expect(data).toHaveProperty("yjsSnapshot");
   expect(data).toHaveProperty("semanticData");
-
-  fs.unlinkSync(tempPath);
-  await page.close();
-  await context.close();
 });
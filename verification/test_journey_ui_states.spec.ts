@@ -12,23 +12,29 @@ const tabs = [
   { tabId: "Data", tabKey: "data", contentText: "Backup & Restore" },
 ];
 
-for (const tab of tabs) {
-  test(`settings tab journey: ${tab.tabId}`, async ({ page }) => {
-    console.log(`Starting Settings Tab Journey: ${tab.tabId}...`);
-    await resetApp(page);
-    await ensureLibraryWithBook(page);
+// One session covers the idle-app and settings smoke screens: the library
+// shot (formerly verify_audio_bookmark_inbox), then every settings tab — the
+// tablist stays mounted (a horizontal strip on mobile), so a fresh app per
+// tab bought nothing. The Dictionary shot also covers the Bible lexicon
+// toggle (formerly verify_bible_toggle).
+test("settings tabs journey", async ({ page }) => {
+  console.log("Starting Settings Tabs Journey...");
+  await resetApp(page);
+  await expect(page.getByTestId("library-view")).toBeVisible();
+  await captureScreenshot(page, "audio_bookmark_inbox");
 
-    // Open Settings (Radix tablist) and activate the target tab.
-    await openSettings(page);
-    await gotoSettingsTab(page, tab.tabKey);
+  // The tab shots (Data Management especially) show a library holding Alice,
+  // as the per-tab tests they replaced did.
+  await ensureLibraryWithBook(page);
+  await openSettings(page);
 
-    // Verify Content (Heading)
+  for (const tab of tabs) {
+    await gotoSettingsTab(page, tab.tabKey);
     await expect(page.getByRole("heading", { name: tab.contentText })).toBeVisible();
-
     await captureScreenshot(page, `settings_tab_${tab.tabId}`);
     console.log(`Settings Tab ${tab.tabId} Passed!`);
-  });
-}
+  }
+});
 
 const dialogs = [
   { dialogName: "toc_sidebar", triggerId: "reader-toc-button" },
@@ -1,6 +1,6 @@
 import type { Page } from '@playwright/test';
 import { test, expect } from "./utils";
-import { resetApp, getReaderFrame, captureScreenshot } from "./utils";
+import { resetApp, getReaderFrame, captureScreenshot, waitForReaderReady } from "./utils";
 import type { Frame } from "@playwright/test";
 
 async function waitForReaderFrame(page: Page): Promise<Frame> {
@@ -20,13 +20,14 @@ test("journey visual reading", async ({ page }) => {
   await resetApp(page);
 
   // 1. Load Book
-  await page.click("text=Load Demo Book");
-  await expect(page.locator("text=Alice's Adventures in Wonderland").first()).toBeVisible({ timeout: 15000 });
-  await page.locator("text=Alice's Adventures in Wonderland").first().click();
+  await page.locator("[data-testid='load-demo-button']").click();
+  const bookCard = page.locator("[data-testid^='book-card-']").first();
+  await expect(bookCard).toBeVisible({ timeout: 15000 });
+  await bookCard.click();
   await expect(page.locator("div[data-testid='reader-iframe-container']")).toBeVisible({ timeout: 5000 });
 
   // Wait for content
-  await page.waitForTimeout(3000);
+  await waitForReaderReady(page);
 
   // Navigate to Chapter 1 (Down the Rabbit-Hole) which is long and ensures multiple pages
   console.log("Navigating to Chapter I...");
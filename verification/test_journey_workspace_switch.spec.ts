@@ -1,6 +1,7 @@
-import { test, expect, openSettings } from "./utils";
+import { test, expect, openSettings, blockDecorativeAssets } from "./utils";
 
 test("journey workspace switch", async ({ page }) => {
+  await blockDecorativeAssets(page);
   // Navigate to app
   await page.addInitScript("window.__VERSICLE_MOCK_FIRESTORE__ = true;");
   // Collapse the MockFireProvider save/download debounce (default 2000ms) so the
@@ -10,20 +11,14 @@ test("journey workspace switch", async ({ page }) => {
   await page.addInitScript("window.__VERSICLE_FIRESTORE_DEBOUNCE_MS__ = 20;");
   await page.goto("/");
 
-  // Bypass the intro dialog if it appears
-  try {
-    await page.getByRole("button", { name: "Continue" }).click({ timeout: 2000 });
-  } catch {
-    // Ignore
-  }
-
   // Open Global Settings. Settings is now the Radix-Tabs SettingsShell at /settings/:tab
   // (route-modal over the library); tabs are real role="tab" triggers.
   await openSettings(page);
 
   // Go to Sync tab
-  await page.getByRole("tab", { name: "Sync & Cloud" }).scrollIntoViewIfNeeded().catch(() => {});
-  await page.getByRole("tab", { name: "Sync & Cloud" }).click();
+  const syncTab = page.getByRole("tab", { name: "Sync & Cloud" });
+  await syncTab.scrollIntoViewIfNeeded().catch(() => {});
+  await syncTab.click();
 
   // In mock mode, sync is auto-enabled without pasting config
 
@@ -63,8 +58,8 @@ test("journey workspace switch", async ({ page }) => {
 
   // Re-open Settings to verify the active workspace changed back
   await openSettings(page);
-  await page.getByRole("tab", { name: "Sync & Cloud" }).scrollIntoViewIfNeeded().catch(() => {});
-  await page.getByRole("tab", { name: "Sync & Cloud" }).click();
+  await syncTab.scrollIntoViewIfNeeded().catch(() => {});
+  await syncTab.click();
 
   // The library should now be connected back to the first workspace
   await expect(page.getByText("Active: My Library")).toBeVisible();
@@ -1,21 +1,19 @@
 import { test, expect } from "./utils";
-import { resetApp, captureScreenshot } from "./utils";
+import { resetApp, captureElementScreenshot } from "./utils";
 
 test("lemonfox settings", async ({ page }) => {
   console.log("Starting LemonFox Settings Verification...");
   await resetApp(page);
 
-  // Wait for library to load
-  await page.waitForTimeout(1000);
-
   // Open Global Settings
   console.log("Opening Global Settings...");
   await page.getByTestId("header-settings-button").click();
 
   // Switch to TTS Engine tab
   console.log("Switching to TTS Engine tab...");
-  await page.getByRole("tab", { name: "TTS Engine" }).scrollIntoViewIfNeeded().catch(() => {});
-  await page.getByRole("tab", { name: "TTS Engine" }).click();
+  const ttsTab = page.getByRole("tab", { name: "TTS Engine" });
+  await ttsTab.scrollIntoViewIfNeeded().catch(() => {});
+  await ttsTab.click();
 
   // Verify we are on TTS tab
   await expect(page.getByText("Provider Configuration")).toBeVisible();
@@ -36,7 +34,7 @@ test("lemonfox settings", async ({ page }) => {
   const apiKeyInput = page.locator("input[type='password']").last();
   await apiKeyInput.fill("test-lemonfox-key");
 
-  await captureScreenshot(page, "lemonfox_settings");
+  await captureElementScreenshot(page.getByRole("dialog"), "lemonfox_settings");
 
   console.log("LemonFox Settings Verification Passed!");
 });
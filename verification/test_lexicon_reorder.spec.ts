@@ -1,15 +1,17 @@
 import { test, expect } from "./utils";
-import { closeSettings, resetApp } from "./utils";
+import { closeSettings, resetApp, blockDecorativeAssets } from "./utils";
 
 test("lexicon reorder", async ({ page }) => {
+  await blockDecorativeAssets(page);
   await resetApp(page);
 
   // Open Global Settings
   await page.getByTestId("header-settings-button").click();
 
   // Go to Dictionary tab
-  await page.getByRole("tab", { name: "Dictionary" }).scrollIntoViewIfNeeded().catch(() => {});
-  await page.getByRole("tab", { name: "Dictionary" }).click();
+  const dictionaryTab = page.getByRole("tab", { name: "Dictionary" });
+  await dictionaryTab.scrollIntoViewIfNeeded().catch(() => {});
+  await dictionaryTab.click();
 
   // Open Manage Rules
   await page.getByRole("button", { name: "Manage Rules" }).click();
@@ -62,8 +64,8 @@ test("lexicon reorder", async ({ page }) => {
 
   // Check again
   await page.getByTestId("header-settings-button").click();
-  await page.getByRole("tab", { name: "Dictionary" }).scrollIntoViewIfNeeded().catch(() => {});
-  await page.getByRole("tab", { name: "Dictionary" }).click();
+  await dictionaryTab.scrollIntoViewIfNeeded().catch(() => {});
+  await dictionaryTab.click();
   await page.getByRole("button", { name: "Manage Rules" }).click();
 
   const reloadedItems = page.locator("[data-testid='lexicon-rules-list'] > div");
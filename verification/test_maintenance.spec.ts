@@ -1,11 +1,5 @@
 import { test, expect } from "./utils";
-import { resetApp, ensureLibraryWithBook, openSettings, acceptConfirm } from "./utils";
-import * as path from "path";
-import { fileURLToPath } from "url";
-import * as fs from "fs";
-
-const __filename = fileURLToPath(import.meta.url);
-const __dirname = path.dirname(__filename);
+import { resetApp, ensureLibraryWithBook, openSettings, acceptConfirm, captureScreenshot } from "./utils";
 
 test("orphan repair", async ({ page }) => {
   console.log("Starting Orphan Repair Verification...");
@@ -49,8 +43,9 @@ test("orphan repair", async ({ page }) => {
   await openSettings(page);
 
   // Go to Data Management Tab (a real Radix role="tab" in the SettingsShell).
-  await page.getByRole("tab", { name: "Data Management" }).scrollIntoViewIfNeeded().catch(() => {});
-  await page.getByRole("tab", { name: "Data Management" }).click();
+  const dataTab = page.getByRole("tab", { name: "Data Management" });
+  await dataTab.scrollIntoViewIfNeeded().catch(() => {});
+  await dataTab.click();
 
   // Click "Check & Repair Database"
   console.log("Running Repair...");
@@ -80,12 +75,7 @@ test("orphan repair", async ({ page }) => {
     await expect(successMsg).toBeVisible();
   } catch (e) {
     // Capture screenshot on failure
-    const screenshotsDir = path.resolve(__dirname, "screenshots");
-    if (!fs.existsSync(screenshotsDir)) {
-      fs.mkdirSync(screenshotsDir, { recursive: true });
-    }
-    const suffix = page.viewportSize()?.width && page.viewportSize()!.width < 600 ? "mobile" : "desktop";
-    await page.screenshot({ path: path.join(screenshotsDir, `maintenance_fail_${suffix}.png`) });
+    await captureScreenshot(page, "maintenance_fail");
     throw e;
   }
 
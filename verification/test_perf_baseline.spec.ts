@@ -17,14 +17,14 @@ import * as fs from 'fs';
 import * as path from 'path';
 import { fileURLToPath } from 'url';
 import { test, expect } from './utils';
-import { resetApp, waitForReaderReady } from './utils';
+import { resetApp, waitForReaderReady, waitForAttached } from './utils';
 import type { Page } from '@playwright/test';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
 const LIBRARY_READY_SELECTOR =
-  "[data-testid^='book-card-'], button:has-text('Load Demo Book'), :text('Your library is empty')";
+  "[data-testid^='book-card-'], [data-testid='empty-library']";
 
 /**
  * Injected before the app: records requestAnimationFrame gaps > 50ms — a
@@ -137,7 +137,7 @@ test('performance baseline: boot, import, open, page turns, warm reload', async
   // ---- Import the demo book ----
   await timed('import-demo-book->card-visible', async () => {
     await page.getByRole('button', { name: 'Load Demo Book' }).click();
-    await page.waitForSelector("[data-testid^='book-card-']", { timeout: 60000 });
+    await waitForAttached(page, "[data-testid^='book-card-']", 60000);
   });
 
   // ---- Open the book, first render ----
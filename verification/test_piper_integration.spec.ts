@@ -1,10 +1,12 @@
 import { test, expect } from "./utils";
-import { captureScreenshot, resetApp } from "./utils";
+import { captureScreenshot, resetApp, blockThirdPartyRequests } from "./utils";
 
 test("piper provider selection", async ({ page }) => {
+  await blockThirdPartyRequests(page);
   await resetApp(page);
 
-  // Mock voices.json to avoid external network dependency
+  // Mock voices.json to avoid external network dependency (registered after
+  // blockThirdPartyRequests, so this route takes precedence for the catalog)
   const mockVoices = {
     "en_US-lessac-high": {
       key: "en_US-lessac-high",
@@ -38,8 +40,9 @@ test("piper provider selection", async ({ page }) => {
   await page.getByRole("button", { name: "Settings" }).click();
 
   // Go to TTS tab
-  await page.getByRole("tab", { name: "TTS Engine" }).scrollIntoViewIfNeeded().catch(() => {});
-  await page.getByRole("tab", { name: "TTS Engine" }).click();
+  const ttsTab = page.getByRole("tab", { name: "TTS Engine" });
+  await ttsTab.scrollIntoViewIfNeeded().catch(() => {});
+  await ttsTab.click();
 
   // Check provider dropdown (initially Web Speech)
   const selectTrigger = page.getByTestId("tts-provider-select");
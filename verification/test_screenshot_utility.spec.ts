@@ -1,11 +1,6 @@
 import { test, expect } from "./utils";
-import { captureScreenshot } from "./utils";
+import { captureScreenshot, flushScreenshots, screenshotPath, writeIfChanged } from "./utils";
 import * as fs from "fs";
-import * as path from "path";
-import { fileURLToPath } from "url";
-
-const __filename = fileURLToPath(import.meta.url);
-const __dirname = path.dirname(__filename);
 
 test("screenshot hides debug overlay", async ({ page }) => {
   // 1. Setup: Create a fake tts-debug element
@@ -32,10 +27,8 @@ test("screenshot hides debug overlay", async ({ page }) => {
   await expect(debugEl).toBeVisible();
 
   // Cleanup
-  const viewport = page.viewportSize();
-  const width = viewport ? viewport.width : 1280;
-  const suffix = width < 600 ? "mobile" : "desktop";
-  const filePath = path.join(__dirname, "screenshots", `${screenshotName}_${suffix}.png`);
+  await flushScreenshots();
+  const filePath = screenshotPath(page, screenshotName);
 
   if (fs.existsSync(filePath)) {
     fs.unlinkSync(filePath);
@@ -49,12 +42,53 @@ test("screenshot ignores missing overlay", async ({ page }) => {
   await captureScreenshot(page, screenshotName, true);
 
   // Cleanup
-  const viewport = page.viewportSize();
-  const width = viewport ? viewport.width : 1280;
-  const suffix = width < 600 ? "mobile" : "desktop";
-  const filePath = path.join(__dirname, "screenshots", `${screenshotName}_${suffix}.png`);
+  await flushScreenshots();
+  const filePath = screenshotPath(page, screenshotName);
 
   if (fs.existsSync(filePath)) {
     fs.unlinkSync(filePath);
   }
 });
+
+test("screenshot leaves an identical image untouched", async ({ page }, testInfo) => {
+  await page.setContent("<html><body><div>Static Content</div></body></html>");
+
+  // Per-project name: desktop and webkit both resolve to *_desktop.jpg and
+  // run in parallel, so a shared name lets one project's write (WebKit
+  // encodes different bytes) or cleanup land in the middle of the other's.
+  const screenshotName = `test_unchanged_${testInfo.project.name}`;
+  const filePath = screenshotPath(page, screenshotName);
+  await captureScreenshot(page, screenshotName);
+  await flushScreenshots();
+  expect(fs.existsSync(filePath)).toBe(true);
+
+  // Same bytes → no write reported; the helper's own answer, so this does
+  // not depend on mtime resolution.
+  const bytes = fs.readFileSync(filePath);
+  expect(await writeIfChanged(filePath, bytes)).toBe(false);
+  expect(await writeIfChanged(filePath, Buffer.concat([bytes, Buffer.from([0])]))).toBe(true);
+  await writeIfChanged(filePath, bytes);
+
+  // End to end: same pixels → same JPEG bytes → the file is left as it was.
+  const before = fs.statSync(filePath);
+  await captureScreenshot(page, screenshotName);
+  await flushScreenshots();
+  const after = fs.statSync(filePath);
+  expect([after.ino, after.size, after.mtimeMs]).toEqual([before.ino, before.size, before.mtimeMs]);
+
+  fs.rmSync(filePath, { force: true });
+});
+
+test("screenshot is on disk once flushed", async ({ page }, testInfo) => {
+  await page.setContent("<html><body><div>Queued Content</div></body></html>");
+
+  // Per-project name, as above: a shared *_desktop.jpg could be unlinked by
+  // the parallel webkit run between the flush and the check.
+  const screenshotName = `test_flushed_${testInfo.project.name}`;
+  const filePath = screenshotPath(page, screenshotName);
+  await captureScreenshot(page, screenshotName);
+  await flushScreenshots();
+  expect(fs.existsSync(filePath)).toBe(true);
+
+  fs.rmSync(filePath, { force: true });
+});
@@ -1,9 +1,10 @@
 import { test, expect } from "./utils";
-import { captureScreenshot, resetApp, ensureLibraryWithBook } from "./utils";
+import { captureScreenshot, openSeededLibrary, LIBRARY_STATE } from "./utils";
+
+test.use({ storageState: LIBRARY_STATE });
 
 test("sidebar height layout", async ({ page }) => {
-  await resetApp(page);
-  await ensureLibraryWithBook(page);
+  await openSeededLibrary(page);
 
   // Open Reader
   await page.locator('[data-testid^="book-card-"]').first().click();
@@ -1,5 +1,5 @@
 import { test, expect } from "./utils";
-import { captureScreenshot, resetApp } from "./utils";
+import { captureScreenshot, resetApp, THEME_CLASS } from "./utils";
 import * as path from "path";
 import { fileURLToPath } from "url";
 
@@ -19,7 +19,7 @@ test("theme selection", async ({ page }) => {
 
   // 2. Verify Light Theme (Default)
   const html = page.locator("html");
-  await expect(html).toHaveClass(/\blight\b/);
+  await expect(html).toHaveClass(THEME_CLASS.light);
 
   // Take screenshot
   await captureScreenshot(page, "theme_1_library_light");
@@ -34,7 +34,7 @@ test("theme selection", async ({ page }) => {
   await page.getByLabel("Select Dark theme").click();
 
   // Verify Dark Class
-  await expect(html).toHaveClass(/\bdark\b/);
+  await expect(html).toHaveClass(THEME_CLASS.dark);
   await captureScreenshot(page, "theme_2_library_dark");
 
   // 5. Switch to Sepia Theme
@@ -42,13 +42,13 @@ test("theme selection", async ({ page }) => {
   await page.getByLabel("Select Sepia theme").click();
 
   // Verify Sepia Class
-  await expect(html).toHaveClass(/\bsepia\b/);
+  await expect(html).toHaveClass(THEME_CLASS.sepia);
   await captureScreenshot(page, "theme_3_library_sepia");
 
   // 6. Switch back to Light
   console.log("Switching to Light Theme...");
   await page.getByLabel("Select Light theme").click();
-  await expect(html).toHaveClass(/\blight\b/);
+  await expect(html).toHaveClass(THEME_CLASS.light);
 
   console.log("Theme Verification Passed!");
 });
@@ -1,10 +1,11 @@
 import { test, expect } from "./utils";
-import { captureScreenshot, resetApp, ensureLibraryWithBook } from "./utils";
+import { captureScreenshot, LIBRARY_STATE, openSeededLibrary } from "./utils";
+
+test.use({ storageState: LIBRARY_STATE });
 
 test("tts cross chapter transition", async ({ page }) => {
   console.log("Starting Cross-Chapter Transition Test...");
-  await resetApp(page);
-  await ensureLibraryWithBook(page);
+  await openSeededLibrary(page);
 
   // Open Book
   await page.locator("[data-testid^='book-card-']").first().click();
@@ -80,8 +81,7 @@ test("tts chapter navigation during playback", async ({ page }) => {
   // passes after the IndexedDB hang fixes (Yjs persistence throttle + hang-safe
   // cache_session_state writes) and the main-thread mock TTS stabilised WebKit playback.
   console.log("Starting Chapter Navigation During Playback Test...");
-  await resetApp(page);
-  await ensureLibraryWithBook(page);
+  await openSeededLibrary(page);
 
   // Open Book
   await page.locator("[data-testid^='book-card-']").first().click();
@@ -1,10 +1,11 @@
 import { test, expect } from "./utils";
-import { captureScreenshot, resetApp, ensureLibraryWithBook, navigateToChapter } from "./utils";
+import { captureScreenshot, LIBRARY_STATE, openSeededLibrary, navigateToChapter, waitForAttribute } from "./utils";
+
+test.use({ storageState: LIBRARY_STATE });
 
 test("tts queue click to jump", async ({ page }) => {
   console.log("Starting Queue Click Jump Test...");
-  await resetApp(page);
-  await ensureLibraryWithBook(page);
+  await openSeededLibrary(page);
 
   // Open Book
   await page.locator("[data-testid^='book-card-']").first().click();
@@ -26,6 +27,7 @@ test("tts queue click to jump", async ({ page }) => {
   const initialCount = await queueItems.count();
   console.log(`Queue has ${initialCount} items`);
   expect(initialCount).toBeGreaterThanOrEqual(3);
+  await captureScreenshot(page, "tts_queue_verification");
 
   // Click on the 3rd item (index 2)
   console.log("Clicking queue item 2...");
@@ -41,8 +43,7 @@ test("tts queue click to jump", async ({ page }) => {
 
 test("tts skip forward button", async ({ page }) => {
   console.log("Starting Skip Forward Test...");
-  await resetApp(page);
-  await ensureLibraryWithBook(page);
+  await openSeededLibrary(page);
 
   // Open Book
   await page.locator("[data-testid^='book-card-']").first().click();
@@ -74,8 +75,7 @@ test("tts skip forward button", async ({ page }) => {
 
 test("tts skip rewind button", async ({ page }) => {
   console.log("Starting Skip Rewind Test...");
-  await resetApp(page);
-  await ensureLibraryWithBook(page);
+  await openSeededLibrary(page);
 
   // Open Book
   await page.locator("[data-testid^='book-card-']").first().click();
@@ -116,8 +116,7 @@ test("tts skip rewind button", async ({ page }) => {
 
 test("tts queue highlight follows playback", async ({ page }) => {
   console.log("Starting Queue Highlight Test...");
-  await resetApp(page);
-  await ensureLibraryWithBook(page);
+  await openSeededLibrary(page);
 
   // Open Book
   await page.locator("[data-testid^='book-card-']").first().click();
@@ -140,20 +139,17 @@ test("tts queue highlight follows playback", async ({ page }) => {
   console.log("Starting playback...");
   await page.getByTestId("tts-play-pause-button").click();
 
-  // Wait for the Mock TTS to progress
+  // Wait for the Mock TTS to move the highlight off item 0 (bounded: a slow
+  // runner may still be on the first sentence, so fall back to checking the
+  // next item is queued).
   console.log("Waiting for playback to progress...");
-  await page.waitForTimeout(5000);
-
-  // Verify we've progressed
-  try {
-    const item0 = page.getByTestId("tts-queue-item-0");
-    const currentAttr = await item0.getAttribute("data-current");
-    if (currentAttr === "true") {
-      console.log("Still on item 0, checking item 1...");
-      await expect(page.getByTestId("tts-queue-item-1")).toBeVisible();
-    }
-  } catch {
-    // Ignore
+  const advanced = await waitForAttribute(page.getByTestId("tts-queue-item-0"), "data-current", "true", {
+    not: true,
+    timeout: 10000,
+  });
+  if (!advanced) {
+    console.log("Still on item 0, checking item 1...");
+    await expect(page.getByTestId("tts-queue-item-1")).toBeVisible();
   }
 
   await captureScreenshot(page, "queue_highlight_playback");
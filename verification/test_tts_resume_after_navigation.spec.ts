@@ -1,11 +1,12 @@
 import { test, expect } from "./utils";
-import { captureScreenshot, resetApp, ensureLibraryWithBook, navigateToChapter, waitForPersistedWrites } from "./utils";
+import { captureScreenshot, LIBRARY_STATE, openSeededLibrary, navigateToChapter, waitForPersistedWrites } from "./utils";
+
+test.use({ storageState: LIBRARY_STATE });
 
 test("tts resume after leaving book", async ({ page, baseURL }) => {
   console.log("Starting Resume After Navigation Test...");
   const finalBaseURL = baseURL || "http://localhost:5173";
-  await resetApp(page);
-  await ensureLibraryWithBook(page);
+  await openSeededLibrary(page);
 
   // Open Book
   console.log("Opening book...");
@@ -116,8 +117,7 @@ test("tts resume after leaving book", async ({ page, baseURL }) => {
 
 test("tts position persists across reload", async ({ page }) => {
   console.log("Starting Position Persistence Across Reload Test...");
-  await resetApp(page);
-  await ensureLibraryWithBook(page);
+  await openSeededLibrary(page);
 
   // Open Book
   await page.locator("[data-testid^='book-card-']").first().click();
@@ -136,8 +136,9 @@ test("tts position persists across reload", async ({ page }) => {
   // Skip to item 5 without starting TTS (forward button works in stopped state too)
   console.log("Advancing to item 5...");
   // Skip with explicit item verification
+  const forwardBtn = page.getByTestId("tts-forward-button");
   for (let i = 1; i <= 5; i++) {
-    await page.getByTestId("tts-forward-button").click();
+    await forwardBtn.click();
     await expect(page.getByTestId(`tts-queue-item-${i}`)).toHaveAttribute("data-current", "true", { timeout: 10000 });
   }
 
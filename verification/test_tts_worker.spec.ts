@@ -25,7 +25,6 @@ test('TTS engine runs in a real Web Worker (full play cycle across the boundary)
     page.on('pageerror', (err) => errors.push(String(err)));
 
     await page.goto('/');
-    await page.waitForLoadState('networkidle').catch(() => { /* SPA may keep connections open */ });
 
     await page.waitForFunction(
         () => typeof window.__ttsWorkerSmokeTest === 'function',
@@ -70,7 +69,6 @@ test('TTS engine runs in a real Web Worker (full play cycle across the boundary)
  */
 test('the app engine (getAudioPlayer) is worker-backed and routes through the Worker', async ({ page }) => {
     await page.goto('/');
-    await page.waitForLoadState('networkidle').catch(() => { /* SPA keeps connections open */ });
     await page.waitForFunction(() => typeof window.__ttsWorkerHandleTest === 'function', null, { timeout: 30000 });
 
     await page.evaluate(() => {
@@ -1,16 +1,6 @@
-import { test, expect, openSettings, acceptConfirm } from "./utils";
-import * as fs from "fs";
-import * as path from "path";
-import { fileURLToPath } from "url";
+import { test, expect, openSettings, acceptConfirm, captureScreenshot } from "./utils";
 
-const __filename = fileURLToPath(import.meta.url);
-const __dirname = path.dirname(__filename);
-
-// Read tts-polyfill.js content
-const ttsPolyfillPath = path.resolve(__dirname, 'tts-polyfill.js');
-const ttsPolyfillContent = fs.readFileSync(ttsPolyfillPath, 'utf8');
-
-test("workspace deletion tombstone", async ({ browser, baseURL }) => {
+test("workspace deletion tombstone", async ({ newDevicePage, baseURL }) => {
   // Two-phase journey (create+delete a workspace, then a fresh stale-client detects the
   // tombstone). It runs in ~8s nominally but spans two browser contexts, multiple reloads
   // and a cross-context sync event, so the default 30s budget is too tight under parallel
@@ -23,15 +13,8 @@ test("workspace deletion tombstone", async ({ browser, baseURL }) => {
   // ============================================
   // STEP 1: Create & Delete Workspace
   // ============================================
-  const context = await browser.newContext();
-  const page = await context.newPage();
-
-  page.on("console", (msg) => console.log(`[APP] ${msg.text()}`));
-  page.on("pageerror", (err) => console.error(`[APP ERROR] ${err}`));
-
-  await page.addInitScript({ content: `window.__VERSICLE_MOCK_FIRESTORE__ = true; window.__VERSICLE_MOCK_USER_ID__ = '${testUid}';` });
-  await page.addInitScript({ content: "window.__VERSICLE_SANITIZATION_DISABLED__ = true;" });
-  await page.addInitScript({ content: ttsPolyfillContent });
+  const mockFirestore = `window.__VERSICLE_MOCK_FIRESTORE__ = true; window.__VERSICLE_MOCK_USER_ID__ = '${testUid}';`;
+  const page = await newDevicePage({ label: "APP", initScript: mockFirestore });
 
   await page.goto(finalBaseURL);
   await expect(page.getByTestId("library-view")).toBeVisible({ timeout: 15000 });
@@ -39,8 +22,9 @@ test("workspace deletion tombstone", async ({ browser, baseURL }) => {
   // Go to Sync Settings. Settings is now the Radix-Tabs SettingsShell at /settings/:tab
   // (opened as a route-modal over the library); tabs are real role="tab" triggers.
   await openSettings(page);
-  await page.getByRole("tab", { name: "Sync & Cloud" }).scrollIntoViewIfNeeded().catch(() => {});
-  await page.getByRole("tab", { name: "Sync & Cloud" }).click();
+  const syncTab = page.getByRole("tab", { name: "Sync & Cloud" });
+  await syncTab.scrollIntoViewIfNeeded().catch(() => {});
+  await syncTab.click();
 
   // In mock mode, sync is auto-enabled without pasting config
   await expect(page.getByRole("heading", { name: "Workspaces" })).toBeVisible();
@@ -64,8 +48,9 @@ test("workspace deletion tombstone", async ({ browser, baseURL }) => {
   console.log(`Workspace ID: ${wsId}`);
 
   // Add some data (Lexicon rule)
-  await page.getByRole("tab", { name: "Dictionary" }).scrollIntoViewIfNeeded().catch(() => {});
-  await page.getByRole("tab", { name: "Dictionary" }).click();
+  const dictionaryTab = page.getByRole("tab", { name: "Dictionary" });
+  await dictionaryTab.scrollIntoViewIfNeeded().catch(() => {});
+  await dictionaryTab.click();
   await page.getByRole("button", { name: "Manage Rules" }).click();
   await page.getByTestId("lexicon-add-rule-btn").click();
   await page.getByTestId("lexicon-input-original").fill("DeleteMe");
@@ -75,8 +60,8 @@ test("workspace deletion tombstone", async ({ browser, baseURL }) => {
 
   // Close Lexicon & go back to Sync & Cloud
   await page.getByTestId("lexicon-close-btn").click();
-  await page.getByRole("tab", { name: "Sync & Cloud" }).scrollIntoViewIfNeeded().catch(() => {});
-  await page.getByRole("tab", { name: "Sync & Cloud" }).click();
+  await syncTab.scrollIntoViewIfNeeded().catch(() => {});
+  await syncTab.click();
 
   // Create a second workspace so we can delete the first one.
   await page.getByPlaceholder("New workspace name").fill("Safe Workspace");
@@ -84,8 +69,8 @@ test("workspace deletion tombstone", async ({ browser, baseURL }) => {
   await expect(page.getByText('Safe Workspace').first()).toBeVisible();
 
   await page.waitForTimeout(2000);
-  await page.screenshot({ path: path.join(__dirname, "screenshots", "deletion_list.png") });
-  console.log("Screenshot saved: deletion_list.png");
+  await captureScreenshot(page, "deletion_list");
+  console.log("Screenshot saved: deletion_list");
 
   // Find the non-active "To Be Deleted" workspace and delete it
   const wsItem = page.locator("div.text-sm.bg-muted\\/50").filter({ hasText: wsId }).first();
@@ -128,22 +113,13 @@ test("workspace deletion tombstone", async ({ browser, baseURL }) => {
   expect(mockData[dbPath].isDeleted).toBe(true);
   console.log("Tombstone verified in mock storage");
 
-  await page.close();
-  await context.close();
+  await page.context().close();
 
   // ============================================
   // STEP 2: Stale Client Detection
   // ============================================
   console.log("\n========== Testing Stale Client Detection ==========");
-  const contextStale = await browser.newContext();
-  const pageStale = await contextStale.newPage();
-
-  pageStale.on("console", (msg) => console.log(`[STALE] ${msg.text()}`));
-  pageStale.on("pageerror", (err) => console.error(`[STALE ERROR] ${err}`));
-
-  await pageStale.addInitScript({ content: `window.__VERSICLE_MOCK_FIRESTORE__ = true; window.__VERSICLE_MOCK_USER_ID__ = '${testUid}';` });
-  await pageStale.addInitScript({ content: "window.__VERSICLE_SANITIZATION_DISABLED__ = true;" });
-  await pageStale.addInitScript({ content: ttsPolyfillContent });
+  const pageStale = await newDevicePage({ label: "STALE", initScript: mockFirestore });
 
   await pageStale.goto(finalBaseURL);
 
@@ -200,7 +176,5 @@ test("workspace deletion tombstone", async ({ browser, baseURL }) => {
     .not.toBe(wsId);
   console.log("Stale client correctly cleared the deleted workspace ID");
 
-  await pageStale.close();
-  await contextStale.close();
   console.log("\n========== TEST PASSED: Workspace Tombstoning Verified! ==========");
 });
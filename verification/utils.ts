@@ -1,6 +1,6 @@
 /* eslint-disable react-hooks/rules-of-hooks */
 import { test as base, expect } from '@playwright/test';
-import type { Page, Frame } from '@playwright/test';
+import type { Page, Frame, Locator, BrowserContext, BrowserContextOptions } from '@playwright/test';
 import * as fs from 'fs';
 import * as path from 'path';
 import { fileURLToPath } from 'url';
@@ -78,13 +78,30 @@ interface VersicleTestApi {
   };
 }
 
+/** Options for the `newDevicePage` fixture. */
+interface DevicePageOptions {
+  /** Prefix for forwarded console lines, e.g. 'A' → `[A] ...`. */
+  label?: string;
+  /** Script run before the app boots (mock Firestore flags, seeded localStorage). */
+  initScript?: string;
+  contextOptions?: BrowserContextOptions;
+}
+
 declare global {
   interface Window {
     __versicleTest?: VersicleTestApi;
   }
 }
 
-export const test = base.extend<{ sanitizationDisabled: boolean }, { _suppressLogs: void }>({
+export const test = base.extend<
+  {
+    sanitizationDisabled: boolean;
+    newContext: (options?: BrowserContextOptions) => Promise<BrowserContext>;
+    newDevicePage: (options?: DevicePageOptions) => Promise<Page>;
+    _screenshotWrites: void;
+  },
+  { _suppressLogs: void }
+>({
   // Sanitization kill-switch injected before app boot. Historically forced ON
   // for the whole suite (the documented honesty gap: CFIs are computed
   // post-sanitize in both pipelines, but the suite measured them with
@@ -110,6 +127,16 @@ export const test = base.extend<{ sanitizationDisabled: boolean }, { _suppressLo
     { scope: 'worker', auto: true },
   ],
 
+  // Drains captureScreenshot's queued disk writes before the test ends, so
+  // artifacts are complete even though specs never wait on the write.
+  _screenshotWrites: [
+    async ({}, use) /* eslint-disable-line no-empty-pattern */ => {
+      await use();
+      await flushScreenshots();
+    },
+    { auto: true },
+  ],
+
   // NOTE: We deliberately use Playwright's default shared-browser-per-worker model.
   // An earlier "fresh WebKit browser per test" override was added to dodge long-run
   // instance degradation — but that degradation was caused by the IndexedDB hangs
@@ -119,6 +146,52 @@ export const test = base.extend<{ sanitizationDisabled: boolean }, { _suppressLo
   // renderer ("Target crashed"). The shared per-worker browser avoids that churn.
   // Trace-on-first-retry is handled by playwright.config.ts (use.trace).
 
+  // Extra contexts on the worker's shared browser for multi-device journeys
+  // (sync handoff, stale-client detection). Each gets the same boot scripts as
+  // the default `page` and is closed at teardown even when the test fails, so
+  // specs neither repeat the polyfill boilerplate nor leak contexts on the
+  // failure path. Spec-specific flags (mock Firestore, user id) stay per-page.
+  newContext: async ({ browser, sanitizationDisabled }, use) => {
+    const contexts: BrowserContext[] = [];
+    await use(async (options) => {
+      const context = await browser.newContext(options);
+      contexts.push(context);
+      // Playwright's 30s defaults only bite on the failure path: a missing
+      // element on a second device should fail in seconds, not half a minute.
+      // 15s rather than the main page's 10s — these pages boot against the
+      // mock Firestore under two-context load.
+      context.setDefaultTimeout(15000);
+      context.setDefaultNavigationTimeout(15000);
+      await context.addInitScript({ content: ttsPolyfillContent });
+      if (sanitizationDisabled) {
+        await context.addInitScript({ content: 'window.__VERSICLE_SANITIZATION_DISABLED__ = true;' });
+      }
+      return context;
+    });
+    // Close concurrently: teardown costs the slowest close, not the sum.
+    // Contexts a journey already closed mid-test (device handoff) no-op here.
+    await Promise.all(contexts.map((context) => context.close()));
+  },
+
+  // One call per simulated device: a fresh context (via newContext), the
+  // device's own boot script, and — when given a label — console/pageerror
+  // forwarding tagged with it. Unlabeled devices stay quiet, as they were
+  // before the fixture existed.
+  newDevicePage: async ({ newContext }, use) => {
+    await use(async ({ label, initScript, contextOptions } = {}) => {
+      const context = await newContext(contextOptions);
+      if (initScript) {
+        await context.addInitScript({ content: initScript });
+      }
+      const page = await context.newPage();
+      if (label) {
+        page.on('console', (msg) => console.log(`[${label}] ${msg.text()}`));
+        page.on('pageerror', (err) => console.error(`[${label}] ERROR ${err}`));
+      }
+      return page;
+    });
+  },
+
   page: async ({ page, sanitizationDisabled }, use, testInfo) => {
     page.setDefaultTimeout(10000);
     page.setDefaultNavigationTimeout(10000);
@@ -179,8 +252,11 @@ export async function navigateToChapter(page: Page, chapterId: string = 'toc-ite
 }
 
 export async function resetApp(page: Page) {
-  await page.goto('/', { timeout: 10000 });
-  await page.reload();
+  // Every navigation here is followed by an explicit app-state wait (the wipe
+  // needs only the origin; waitForAppBoot below needs the library), so don't
+  // also sit out the `load` event's images and fonts.
+  await page.goto('/', { timeout: 10000, waitUntil: 'domcontentloaded' });
+  await page.reload({ waitUntil: 'domcontentloaded' });
 
   await page.evaluate(async () => {
     // Unregister Service Workers (with timeout — WebKit's unregister() can hang indefinitely)
@@ -240,25 +316,37 @@ export async function resetApp(page: Page) {
     localStorage.clear();
   });
 
-  await page.reload();
+  await page.reload({ waitUntil: 'domcontentloaded' });
 
   try {
-    try {
-      await page.waitForSelector('text=Updating Library', { state: 'detached', timeout: 10000 });
-    } catch {
-      // Ignore
-    }
-
-    await page.waitForSelector(
-      "[data-testid^='book-card-'], button:has-text('Load Demo Book'), :text('Your library is empty')",
-      { timeout: 45000 }
-    );
+    await waitForAppBoot(page, 45000);
   } catch (err) {
+    if (err instanceof SafeModeError) throw err;
     console.warn(`Warning: App load state check failed: ${err}`);
     await captureScreenshot(page, 'reset_app_timeout_debug');
   }
 }
 
+class SafeModeError extends Error {}
+
+/**
+ * Wait for boot to settle on the library (a book card or the empty state)
+ * OR on Safe Mode, whichever renders first. Boot failures land in
+ * SafeModeView, which the library selectors never match — so rather than
+ * sitting out the whole timeout and failing later on a confusing locator,
+ * throw as soon as the Safe Mode screen is up. Plain `data-testid` CSS
+ * selectors: this runs on every reset, and text/role engines scan the DOM.
+ */
+async function waitForAppBoot(page: Page, timeout: number) {
+  const library = page.locator("[data-testid^='book-card-'], [data-testid='empty-library']");
+  const safeMode = page.locator("[data-testid='safe-mode-view']");
+  await library.or(safeMode).first().waitFor({ timeout });
+  if (await safeMode.isVisible()) {
+    await captureScreenshot(page, 'boot_safe_mode');
+    throw new SafeModeError('App booted into Safe Mode instead of the library');
+  }
+}
+
 /**
  * Wait for the app's debounced IndexedDB writes to reach disk before a hard `page.reload()`.
  *
@@ -293,45 +381,241 @@ export async function waitForPersistedWrites(page: Page) {
   }
 }
 
+/**
+ * Abort every request that leaves the app's own origin (fonts/CDNs, Piper's
+ * huggingface catalog, Google APIs, analytics). Reader journeys never need
+ * them, and in the Docker lane they otherwise sit in DNS/TCP until they time
+ * out. Call before the first `page.goto`. Specs that exercise a remote
+ * destination mock it with their own `page.route` instead (registered after
+ * this one, so it wins).
+ */
+export async function blockThirdPartyRequests(page: Page) {
+  await page.route(
+    (url) => url.hostname !== 'localhost' && url.hostname !== '127.0.0.1',
+    (route) => route.abort(),
+  );
+}
+
+/**
+ * Resolve as soon as `selector` is attached, driven by a MutationObserver in
+ * the page instead of Playwright's retry backoff (which can add up to a few
+ * hundred ms per wait once its polling interval has grown). Attached, not
+ * visible — use it for elements that render visible (cards, views), on waits
+ * that do not span a navigation: a navigation destroys the observer's context.
+ */
+export async function waitForAttached(page: Page, selector: string, timeout = 10000): Promise<void> {
+  await page.evaluate(
+    ({ selector, timeout }) =>
+      new Promise<void>((resolve, reject) => {
+        if (document.querySelector(selector)) return resolve();
+        const observer = new MutationObserver(() => {
+          if (document.querySelector(selector)) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve();
+          }
+        });
+        const timer = setTimeout(() => {
+          observer.disconnect();
+          reject(new Error(`Timed out after ${timeout}ms waiting for ${selector}`));
+        }, timeout);
+        observer.observe(document.documentElement, { childList: true, subtree: true, attributes: true });
+      }),
+    { selector, timeout },
+  );
+}
+
+/**
+ * `isVisible()` with a waiting budget: resolves true as soon as the locator
+ * is visible, false once `timeout` passes. Use it for "if X shows up, do Y"
+ * branches — a bare `isVisible()` answers instantly, so a UI that is 50ms
+ * late to hydrate sends the spec down the wrong branch.
+ */
+export async function becomesVisible(locator: Locator, timeout = 2000): Promise<boolean> {
+  return locator.waitFor({ state: 'visible', timeout }).then(
+    () => true,
+    () => false,
+  );
+}
+
+/**
+ * `becomesVisible` for an attribute: resolves true once `name` matches
+ * `value` (or, with `not`, stops matching) within `timeout`, false otherwise.
+ * For optional state the spec branches or logs on — not a hidden assertion.
+ */
+export async function waitForAttribute(
+  locator: Locator,
+  name: string,
+  value: string | RegExp,
+  { not = false, timeout = 2000 }: { not?: boolean; timeout?: number } = {},
+): Promise<boolean> {
+  const assertion = not ? expect(locator).not : expect(locator);
+  return assertion.toHaveAttribute(name, value, { timeout }).then(
+    () => true,
+    () => false,
+  );
+}
+
+/**
+ * Abort the app's decorative same-origin assets: PWA icons/logos and the
+ * ~800KB Versicle Sans Narrow pinyin font. For specs whose assertions are about
+ * chrome and navigation rather than pixels (book covers are IndexedDB blob:
+ * URLs and never reach the router, so they still render). Don't use it in
+ * specs whose screenshots or geometry are the artifact — reader typography,
+ * pinyin overlays, visual settings.
+ */
+export async function blockDecorativeAssets(page: Page) {
+  await page.route(/\.(png|jpe?g|webp|ico|woff2?|ttf)(\?.*)?$/, (route) => route.abort());
+}
+
+/**
+ * Storage snapshot (localStorage + IndexedDB) of a library holding the demo
+ * book, written once per run by library.setup.ts. Opt in per spec with
+ * `test.use({ storageState: LIBRARY_STATE })` and open the app with
+ * `openSeededLibrary` instead of `resetApp` + `ensureLibraryWithBook`.
+ * The file must exist when the context is created: run those specs through a
+ * project that depends on `library-setup` (desktop, mobile, webkit do). With
+ * the setup skipped or failed, context creation fails with ENOENT.
+ */
+export const LIBRARY_STATE = path.resolve(__dirname, '.state', 'library.json');
+
+/**
+ * `<html>` class matchers, one per theme. Bounded by whitespace rather than
+ * `\b`: a hyphen is a word boundary, so `/\bdark\b/` would also accept a
+ * class like `dark-mode-toggle`.
+ */
+export const THEME_CLASS = {
+  light: /(^|\s)light(\s|$)/,
+  dark: /(^|\s)dark(\s|$)/,
+  sepia: /(^|\s)sepia(\s|$)/,
+};
+
+/**
+ * Open the library in a context restored from LIBRARY_STATE. Each test still
+ * gets its own context (isolation is unchanged) — it just starts with Alice
+ * already ingested. Falls back to `ensureLibraryWithBook`, so a stale
+ * snapshot (present but without the book) degrades to the slow path instead
+ * of failing the spec. A missing snapshot fails earlier; see LIBRARY_STATE.
+ */
+export async function openSeededLibrary(page: Page) {
+  await page.goto('/', { waitUntil: 'domcontentloaded' });
+  await ensureLibraryWithBook(page);
+}
+
+/**
+ * Budget for the one genuinely slow step in the suite: parsing an EPUB and
+ * ingesting it into IndexedDB until its book card renders. Everything else
+ * runs on the fixture's 10s defaults, so a wrong locator fails in seconds
+ * instead of burning a padded per-call timeout.
+ */
+export const INGEST_TIMEOUT = 30000;
+
+// The demo book, byte-identical to public/books/alice.epub and uploaded under
+// the name the Load Demo button gives it. Read once per worker.
+const DEMO_BOOK = {
+  name: 'Alice in Wonderland.epub',
+  mimeType: 'application/epub+zip',
+  buffer: fs.readFileSync(path.resolve(__dirname, 'alice.epub')),
+};
+
+/**
+ * Make sure the library holds the demo book. A populated library returns
+ * as-is; an empty one gets the EPUB straight into the hidden file input,
+ * the same import pipeline as the Load Demo button minus its fetch of
+ * /books/alice.epub (test_journey_library.spec.ts covers the button itself).
+ */
 export async function ensureLibraryWithBook(page: Page) {
   try {
-    await page.waitForSelector(
-      "[data-testid^='book-card-'], button:has-text('Load Demo Book'), :text('Your library is empty')",
-      { timeout: 45000 }
-    );
+    await waitForAppBoot(page, 45000);
   } catch (err) {
+    if (err instanceof SafeModeError) throw err;
     console.warn(`Warning: Neither book card nor load button found within 45s: ${err}`);
     await captureScreenshot(page, 'ensure_library_timeout_debug');
   }
 
-  if ((await page.getByText("Alice's Adventures in Wonderland").count()) > 0) {
+  if ((await page.locator("[data-testid^='book-card-']").count()) > 0) {
     return;
   }
 
-  let loadBtn = page.getByRole('button', { name: 'Load Demo Book' });
-  if ((await loadBtn.count()) === 0) {
-    loadBtn = page.locator('button').filter({ hasText: 'Load Demo Book' });
-  }
+  const emptyLibrary = page.getByTestId('empty-library');
+  const fileInput = page.getByTestId('hidden-file-input');
 
-  if ((await loadBtn.count()) > 0 && (await loadBtn.first().isVisible())) {
-    await loadBtn.first().click();
+  if (await emptyLibrary.isVisible()) {
+    await fileInput.setInputFiles(DEMO_BOOK);
     try {
-      await page.waitForSelector("[data-testid^='book-card-']", { timeout: 30000 });
+      await waitForAttached(page, "[data-testid^='book-card-']", INGEST_TIMEOUT);
     } catch {
-      if (await loadBtn.first().isVisible()) {
-        await loadBtn.first().click();
-        await page.waitForSelector("[data-testid^='book-card-']", { timeout: 30000 });
+      if (await emptyLibrary.isVisible()) {
+        await fileInput.setInputFiles(DEMO_BOOK);
+        await waitForAttached(page, "[data-testid^='book-card-']", INGEST_TIMEOUT);
       }
     }
   }
 }
 
-export async function captureScreenshot(page: Page, name: string, hideTtsStatus: boolean = false) {
-  const screenshotsDir = path.resolve(__dirname, 'screenshots');
-  if (!fs.existsSync(screenshotsDir)) {
-    fs.mkdirSync(screenshotsDir, { recursive: true });
-  }
+/**
+ * Where `captureScreenshot(page, name)` writes for the page's current viewport:
+ * `screenshots/<name>_{mobile,desktop}.jpg`.
+ */
+export function screenshotPath(page: Page, name: string): string {
+  const viewport = page.viewportSize();
+  const width = viewport ? viewport.width : 1280;
+  const suffix = width < 600 ? 'mobile' : 'desktop';
+  return path.resolve(__dirname, 'screenshots', `${name}_${suffix}.jpg`);
+}
+
+/**
+ * Write `data` unless `file` already holds exactly those bytes. Screenshots of
+ * an unchanged UI encode identically run to run, and the local lane mounts
+ * verification/screenshots, so skipping the rewrite keeps their mtimes stable
+ * for artifact sync and image-diff tooling. A plain byte compare, not a
+ * sidecar hash: the previous image is the only state we need. Resolves to
+ * whether it wrote.
+ */
+export async function writeIfChanged(file: string, data: Buffer): Promise<boolean> {
+  const existing = await fs.promises.readFile(file).catch(() => null);
+  if (existing && existing.equals(data)) return false;
+  await fs.promises.mkdir(path.dirname(file), { recursive: true });
+  await fs.promises.writeFile(file, data);
+  return true;
+}
 
+// Screenshot files are written off the test's critical path: the capture is
+// awaited (it must reflect the UI at that moment), the compare + disk write
+// is chained here and drained by the auto `_screenshotWrites` fixture at
+// teardown. One chain keeps writes to the same name in call order. A failed
+// write doesn't break the chain for later shots, but it is held and rethrown
+// by the next flush, so a missing artifact still fails the test.
+let screenshotWrites: Promise<void> = Promise.resolve();
+let screenshotWriteError: Error | null = null;
+
+/**
+ * Resolve once every screenshot queued so far is on disk; reject with the
+ * first write that failed since the previous flush.
+ */
+export async function flushScreenshots(): Promise<void> {
+  await screenshotWrites;
+  const err = screenshotWriteError;
+  screenshotWriteError = null;
+  if (err) throw err;
+}
+
+function queueScreenshotWrite(page: Page, name: string, image: Buffer) {
+  const file = screenshotPath(page, name);
+  screenshotWrites = screenshotWrites.then(() =>
+    writeIfChanged(file, image).catch((err) => {
+      if (!screenshotWriteError) screenshotWriteError = new Error(`Screenshot ${name} not saved: ${err}`);
+    }),
+  );
+}
+
+/**
+ * Save a viewport screenshot for humans / CI artifacts. JPEG at quality 70:
+ * there are no golden-image assertions, so lossless PNG bought nothing but
+ * encode time and artifact size (roughly 5-10x larger). Resolves once the
+ * image is captured; the file lands when `flushScreenshots()` drains.
+ */
+export async function captureScreenshot(page: Page, name: string, hideTtsStatus: boolean = false) {
   if (hideTtsStatus) {
     await page.evaluate(() => {
       const el = document.getElementById('tts-debug');
@@ -346,10 +630,8 @@ export async function captureScreenshot(page: Page, name: string, hideTtsStatus:
     }
   }
 
-  const viewport = page.viewportSize();
-  const width = viewport ? viewport.width : 1280;
-  const suffix = width < 600 ? 'mobile' : 'desktop';
-  await page.screenshot({ path: path.join(screenshotsDir, `${name}_${suffix}.png`), timeout: 10000 });
+  const image = await page.screenshot({ type: 'jpeg', quality: 70, timeout: 10000 });
+  queueScreenshotWrite(page, name, image);
 
   if (hideTtsStatus) {
     await page.evaluate(() => {
@@ -361,6 +643,16 @@ export async function captureScreenshot(page: Page, name: string, hideTtsStatus:
   }
 }
 
+/**
+ * `captureScreenshot` for one element: clipped to the locator's box, so a
+ * component shot (the compass pill, a popover) encodes and stores a few KB
+ * instead of the whole viewport. Same JPEG settings, same queued write.
+ */
+export async function captureElementScreenshot(locator: Locator, name: string) {
+  const image = await locator.screenshot({ type: 'jpeg', quality: 70, timeout: 10000 });
+  queueScreenshotWrite(locator.page(), name, image);
+}
+
 export function getReaderFrame(page: Page): Frame | null {
   for (const frame of page.frames()) {
     if (frame !== page.mainFrame() && (frame.name().includes('epubjs') || frame.url().includes('blob:'))) {
@@ -399,9 +691,10 @@ export async function openSettings(page: Page) {
 export async function gotoSettingsTab(page: Page, id: string) {
   // On the mobile (375x667) vertical tablist the lower tabs (data/recovery/
   // diagnostics) sit below the fold — scroll before clicking.
-  await page.getByTestId(`settings-tab-${id}`).scrollIntoViewIfNeeded().catch(() => {});
-  await page.getByTestId(`settings-tab-${id}`).click();
-  await expect(page.getByTestId(`settings-tab-${id}`)).toHaveAttribute('aria-selected', 'true');
+  const tab = page.getByTestId(`settings-tab-${id}`);
+  await tab.scrollIntoViewIfNeeded().catch(() => {});
+  await tab.click();
+  await expect(tab).toHaveAttribute('aria-selected', 'true');
 }
 
 /**
@@ -1,20 +0,0 @@
-import { test } from "./utils";
-import { captureScreenshot } from "./utils";
-
-test("verify audio bookmark inbox", async ({ page, baseURL }) => {
-  const finalBaseURL = baseURL || "http://localhost:5173";
-  console.log("Navigating to app...");
-  
-  await page.goto(finalBaseURL, { timeout: 60000 });
-
-  console.log("Waiting for Library view... (May timeout due to known IDB issue in headless Chromium)");
-
-  try {
-    await page.waitForSelector('[data-testid="library-view"]', { timeout: 5000 });
-  } catch {
-    console.log("IndexedDB hung as expected. Taking best-effort fallback screenshot.");
-  }
-
-  await page.waitForTimeout(2000);
-  await captureScreenshot(page, "audio_bookmark_inbox");
-});
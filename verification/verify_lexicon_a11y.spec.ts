@@ -8,8 +8,9 @@ test("lexicon accessibility", async ({ page }) => {
   await page.getByTestId("header-settings-button").click();
 
   // 2. Switch to Dictionary tab
-  await page.getByRole("tab", { name: "Dictionary" }).scrollIntoViewIfNeeded().catch(() => {});
-  await page.getByRole("tab", { name: "Dictionary" }).click();
+  const dictionaryTab = page.getByRole("tab", { name: "Dictionary" });
+  await dictionaryTab.scrollIntoViewIfNeeded().catch(() => {});
+  await dictionaryTab.click();
 
   // 3. Open Lexicon Manager
   await page.getByRole("button", { name: "Manage Rules" }).click();
@@ -30,9 +31,11 @@ test("lexicon accessibility", async ({ page }) => {
   await page.getByLabel("Save rule").click();
 
   // Now verify the list item buttons
-  await expect(page.getByLabel("Move rule up")).toBeVisible();
-  await expect(page.getByLabel("Move rule down")).toBeVisible();
-  await expect(page.getByLabel("Delete rule")).toBeVisible();
+  await Promise.all([
+    expect(page.getByLabel("Move rule up")).toBeVisible(),
+    expect(page.getByLabel("Move rule down")).toBeVisible(),
+    expect(page.getByLabel("Delete rule")).toBeVisible(),
+  ]);
 
   // Also check the tabs
   await expect(page.getByRole("tab", { name: "Global" })).toBeVisible();